@@ -1,30 +1,35 @@
 # app.py - Enhanced AI Resume Analyzer with Comprehensive Improvements
+import io
 import os
+import re
 import sys
 import time
 import tempfile
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Callable
 
 import streamlit as st
-import google.generativeai as genai
-from pdf2image import convert_from_path
-import pytesseract
-import pdfplumber
+
+# Heavy SDKs (google.generativeai, pypdfium2, pdfplumber, pdf2image, tesserocr, pytesseract)
+# are imported lazily where used so reruns and cold starts only pay for the features in use
 
 # Import our enhanced modules
 try:
     from config import api_config, app_config, ui_config, setup_logging, validate_api_keys
     from utils import (
-        validate_file, sanitize_filename, generate_file_hash, temporary_file,
+        validate_file, sanitize_filename, generate_file_hash, generate_file_hash_stream,
+        generate_text_hash,
         safe_execute, display_error, display_success, create_progress_tracker,
-        log_user_action, handle_streamlit_error, ValidationError, ProcessingError
+        log_user_action, handle_streamlit_error, ValidationError, ProcessingError,
+        ResultCache
     )
     from jobs_api_improved import search_all_apis, JobResult, get_job_search_stats
     from matching_improved import AdvancedJobMatcher, create_enhanced_profile_from_basic
-    from utils_profile_improved import ProfileExtractor
+    from utils_profile_improved import profile_extractor
 except ImportError as e:
     st.error(f"Failed to import required modules: {e}")
     st.info("Please ensure all required files are present and dependencies are installed.")
@@ -33,12 +38,96 @@ except ImportError as e:
 # Initialize logging
 logger = setup_logging()
 
+# Static persona and output format, sent once as the model's system instruction
+ANALYSIS_SYSTEM_PROMPT = """You are an experienced HR professional with technical expertise across Data Science, Software Engineering, DevOps, ML/AI, Full Stack Development, Marketing and more.
+Evaluate the resume in concise Markdown using exactly the sections requested."""
+
+# Section rubrics specialized per experience bucket so output tokens go to what matters
+# at that career stage (e.g. no course list for senior profiles); every bucket offers the
+# full Experience Level label list, so a wrong bucket guess never forces a wrong label
+PROMPT_JUNIOR = """Sections:
+1. **Professional Summary**: one line
+2. **Experience Level**: Student/Intern/Junior/Mid-level/Senior/Executive
+3. **Existing Skills**: technical and relevant soft skills
+4. **Skill Gaps**: skills to build for a first or next role
+5. **Course Recommendations**: 3-5 specific courses/certifications
+6. **Strengths**
+7. **Areas for Improvement**: resume content and presentation"""
+
+PROMPT_MID = """Sections:
+1. **Professional Summary**: one line
+2. **Experience Level**: Student/Intern/Junior/Mid-level/Senior/Executive
+3. **Existing Skills**: technical and relevant soft skills
+4. **Skill Gaps**: missing or weak skills for career growth
+5. **Course Recommendations**: 3-5 specific courses/certifications
+6. **Strengths**
+7. **Areas for Improvement**
+8. **Industry Readiness**: readiness for target roles"""
+
+PROMPT_SENIOR = """Sections:
+1. **Professional Summary**: one line
+2. **Experience Level**: Student/Intern/Junior/Mid-level/Senior/Executive
+3. **Existing Skills**: core technical and leadership skills
+4. **Strengths**: impact, scope and leadership
+5. **Skill Gaps**: gaps for the next senior or executive step
+6. **Areas for Improvement**
+7. **Industry Readiness**: readiness for target roles"""
+
+EXPERIENCE_BUCKET_PROMPTS = {
+    "junior": PROMPT_JUNIOR,
+    "mid": PROMPT_MID,
+    "senior": PROMPT_SENIOR
+}
+
+ANALYSIS_JOB_FIT_PROMPT = """Also add:
+- **Job Compatibility Score**: 0-100%
+- **Job-Specific Strengths**
+- **Job-Specific Gaps**
+- **Recommendation**: whether to apply and next steps"""
+
+# Cheap local signals used to pick a prompt bucket before the LLM call
+# Only "N years of (professional|work|...) experience" counts, not company age or degree length
+YEARS_OF_EXPERIENCE_PATTERN = re.compile(
+    r'\b(\d{1,2})\+?\s*(?:years?|yrs?)\.?\s+of\s+(?:(?:professional|work|industry|relevant|hands-on)\s+)?experience\b',
+    re.IGNORECASE
+)
+EARLY_CAREER_PATTERN = re.compile(r'\b(?:student|intern|internship|fresher|graduate|undergraduate)\b', re.IGNORECASE)
+
+ANALYSIS_MODEL_NAME = "models/gemini-2.5-flash"
+# Bump whenever the analysis prompts change so cached analyses from older prompts are not served
+ANALYSIS_PROMPT_VERSION = "2"
+
+# Lifetime of the server-side Gemini context cache holding system prompt + resume
+CONTEXT_CACHE_TTL = timedelta(hours=1)
+# Gemini rejects context caches below this many tokens (gemini-2.5-flash minimum); at
+# ~4 characters per token, shorter resumes skip the create call instead of failing it
+CONTEXT_CACHE_MIN_TOKENS = 1024
+CHARS_PER_TOKEN_ESTIMATE = 4
+
+# Resumes rarely exceed this; OCR noise beyond it only inflates input tokens
+MAX_RESUME_CHARS = 16000
+
+# Pages whose direct text layer is shorter than this are treated as scanned and OCRed;
+# born-digital PDFs therefore skip OCR entirely
+MIN_PAGE_CHARS = 20
+
+# OCR worker threads (Tesseract runs outside the GIL) and rasterization settings;
+# 150 DPI grayscale is ample for 10-12pt resume text and cuts OCR pixels ~4x
+OCR_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+OCR_DPI = 150
+# Treat each page as a single uniform block of text (skip full layout analysis), LSTM engine only
+OCR_TESSERACT_CONFIG = "--psm 6 --oem 1 -l eng"
+
 class ResumeAnalyzer:
     """Enhanced Resume Analyzer with better error handling and features"""
     
     def __init__(self):
-        self.profile_extractor = ProfileExtractor()
+        self.profile_extractor = profile_extractor
         self.job_matcher = AdvancedJobMatcher()
+        self.analysis_cache = ResultCache("analysis")
+        self._tess_local = threading.local()
+        # Created up front: the analyzer is shared across sessions, and worker threads start lazily anyway
+        self._ocr_executor = ThreadPoolExecutor(max_workers=OCR_MAX_WORKERS, thread_name_prefix="ocr")
         self._initialize_ai_model()
     
     def _initialize_ai_model(self):
@@ -46,12 +135,17 @@ class ResumeAnalyzer:
         try:
             if not api_config.google_api_key:
                 raise ValueError("Google API key not configured")
+            import google.generativeai as genai
             genai.configure(api_key=api_config.google_api_key)
-            self.model = genai.GenerativeModel("models/gemini-2.5-flash")
+            self.model = genai.GenerativeModel(
+                ANALYSIS_MODEL_NAME,
+                system_instruction=ANALYSIS_SYSTEM_PROMPT
+            )
             logger.info("AI model initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize AI model: {e}")
             raise ProcessingError(f"AI model not available: {str(e)}")
+    
     def extract_text_from_pdf(self, pdf_file) -> str:
         """Enhanced PDF text extraction with better error handling"""
         if not pdf_file:
@@ -63,45 +157,40 @@ class ResumeAnalyzer:
             progress.update("Validating file")
             validate_file(pdf_file, app_config.max_file_size_mb, app_config.allowed_file_types)
             
-            with temporary_file(suffix='.pdf') as temp_file:
-                progress.update("Saving temporary file")
-                temp_file.write(pdf_file.read())
-                temp_file.flush()
-                
-                text = ""
-                
-                # Try direct text extraction first
-                try:
-                    progress.update("Extracting text directly")
-                    with pdfplumber.open(temp_file.name) as pdf:
-                        for page in pdf.pages:
-                            page_text = page.extract_text()
-                            if page_text:
-                                text += page_text + "\n"
-                    
-                    if text.strip():
-                        progress.complete("Text extraction successful")
-                        logger.info(f"Successfully extracted {len(text)} characters from PDF")
-                        return text.strip()
-                
-                except Exception as e:
-                    logger.warning(f"Direct text extraction failed: {e}")
-                
-                # Fallback to OCR
-                logger.info("Falling back to OCR extraction")
+            progress.update("Reading file")
+            # getvalue() returns the whole upload regardless of the stream position left by earlier reads
+            pdf_bytes = pdf_file.getvalue() if hasattr(pdf_file, "getvalue") else pdf_file.read()
+            
+            # Direct per-page extraction first (PDFium, then pdfplumber)
+            page_texts = []
+            try:
+                progress.update("Extracting text directly")
+                page_texts = self._extract_pages_direct(pdf_bytes)
+            except Exception as e:
+                logger.warning(f"Direct text extraction failed: {e}")
+            
+            # OCR only the pages without a usable text layer (all pages if direct extraction failed)
+            ocr_indexes = [i for i, page_text in enumerate(page_texts) if len(page_text.strip()) < MIN_PAGE_CHARS]
+            if ocr_indexes or not page_texts:
+                logger.info(f"Falling back to OCR extraction for {len(ocr_indexes) or 'all'} page(s)")
                 try:
-                    images = convert_from_path(temp_file.name)
-                    for i, image in enumerate(images):
-                        page_text = pytesseract.image_to_string(image)
-                        text += f"Page {i+1}:\n{page_text}\n\n"
-                    
-                    progress.complete("OCR extraction successful")
-                    logger.info(f"OCR extracted {len(text)} characters from PDF")
-                    return text.strip()
+                    if page_texts:
+                        ocr_texts = self._ocr_pages(pdf_bytes, ocr_indexes)
+                        for i, page_text in zip(ocr_indexes, ocr_texts):
+                            page_texts[i] = page_text
+                    else:
+                        page_texts = self._ocr_pages(pdf_bytes)
                 
                 except Exception as ocr_error:
-                    logger.error(f"OCR extraction failed: {ocr_error}")
-                    raise ProcessingError(f"Failed to extract text from PDF: {ocr_error}")
+                    if not any(page_text.strip() for page_text in page_texts):
+                        logger.error(f"OCR extraction failed: {ocr_error}")
+                        raise ProcessingError(f"Failed to extract text from PDF: {ocr_error}")
+                    logger.warning(f"OCR extraction failed, using direct text: {ocr_error}")
+            
+            text = "\n".join(page_texts).strip()
+            progress.complete("Text extraction successful")
+            logger.info(f"Successfully extracted {len(text)} characters from PDF")
+            return text
         
         except ValidationError:
             raise
@@ -109,66 +198,157 @@ class ResumeAnalyzer:
             logger.error(f"PDF text extraction error: {e}")
             raise ProcessingError(f"Error processing PDF file: {e}")
     
-    def analyze_resume(self, resume_text: str, job_description: Optional[str] = None) -> Dict[str, Any]:
-        """Enhanced resume analysis with comprehensive error handling"""
+    def _extract_pages_direct(self, pdf_bytes: bytes) -> List[str]:
+        """Extract per-page text layers, preferring PDFium and falling back to pdfplumber"""
+        page_texts = []
+        try:
+            page_texts = self._extract_text_pdfium(pdf_bytes)
+        except ImportError:
+            pass  # pypdfium2 not installed
+        except Exception as e:
+            logger.warning(f"PDFium text extraction failed: {e}")
+        
+        if sum(len(page_text.strip()) for page_text in page_texts) < 50:
+            page_texts = self._extract_text_pdfplumber(pdf_bytes)
+        return page_texts
+    
+    def _extract_text_pdfium(self, pdf_bytes: bytes) -> List[str]:
+        """Extract per-page text with PDFium native bindings"""
+        import pypdfium2 as pdfium
+        
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            return [page.get_textpage().get_text_range() for page in pdf]
+        finally:
+            pdf.close()
+    
+    def _extract_text_pdfplumber(self, pdf_bytes: bytes) -> List[str]:
+        """Extract per-page text with pdfplumber (slower pure-Python fallback)"""
+        import pdfplumber
+        
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            return [page.extract_text() or "" for page in pdf.pages]
+    
+    def _ocr_pages(self, pdf_bytes: bytes, page_indexes: Optional[List[int]] = None) -> List[str]:
+        """Rasterize and OCR the given zero-based pages (all pages when None)"""
+        from pdf2image import convert_from_bytes
+        
+        if page_indexes is None:
+            images = convert_from_bytes(
+                pdf_bytes, dpi=OCR_DPI, grayscale=True, thread_count=OCR_MAX_WORKERS
+            )
+        else:
+            # One pdftoppm run over the covering range beats one subprocess per page
+            first_page = min(page_indexes)
+            range_images = convert_from_bytes(
+                pdf_bytes, dpi=OCR_DPI, grayscale=True, thread_count=OCR_MAX_WORKERS,
+                first_page=first_page + 1, last_page=max(page_indexes) + 1
+            )
+            images = [range_images[i - first_page] for i in page_indexes]
+        return self._ocr_images(images)
+    
+    def _ocr_image(self, image) -> str:
+        """
+        OCR a page image in-process via a preloaded per-thread tesserocr API.
+        Falls back to pytesseract (one tesseract subprocess per page) when the
+        tesserocr bindings are not installed.
+        """
+        try:
+            import tesserocr
+        except ImportError:
+            tesserocr = None
+        
+        if tesserocr is not None:
+            api = getattr(self._tess_local, "api", None)
+            if api is None:
+                api = tesserocr.PyTessBaseAPI(
+                    lang='eng', psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY
+                )
+                self._tess_local.api = api
+                logger.info("Tesseract API preloaded for OCR")
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        
+        import pytesseract
+        return pytesseract.image_to_string(image, config=OCR_TESSERACT_CONFIG)
+    
+    def _ocr_images(self, images: List[Any]) -> List[str]:
+        """
+        OCR page images on the long-lived OCR workers, preserving page order.
+        Even a single page goes through the pool: the script thread changes on
+        every rerun, so only the workers' per-thread Tesseract APIs get reused.
+        """
+        return list(self._ocr_executor.map(self._ocr_image, images))
+    
+    def analyze_resume(self, resume_text: str, job_description: Optional[str] = None,
+                       on_chunk: Optional[Callable[[str], Any]] = None,
+                       context_cache_names: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+        """
+        Enhanced resume analysis with comprehensive error handling
+        Args:
+            resume_text: Extracted resume text
+            job_description: Optional job description for targeted analysis
+            on_chunk: Optional callback receiving the partial analysis text as it streams in
+            context_cache_names: Optional resume hash -> Gemini cache name store (e.g. per
+                session); context caching is only attempted when one is given
+        Returns:
+            Dict with analysis text and resume metrics
+        """
         if not resume_text or not resume_text.strip():
             raise ValidationError("Resume text is required for analysis")
         
         if not self.model:
             raise ProcessingError("AI model not available. Please check your API configuration.")
         
+        # Re-analysis of the same resume + job description skips the LLM call entirely
+        cache_key = generate_text_hash(
+            ANALYSIS_MODEL_NAME, ANALYSIS_PROMPT_VERSION, resume_text, job_description or ""
+        )
+        cached_result = self.analysis_cache.get(cache_key)
+        if cached_result:
+            logger.info("Returning cached resume analysis")
+            return cached_result
+        
         progress = create_progress_tracker(3, "Analyzing resume")
         
         try:
             progress.update("Preparing analysis prompt")
             
-            base_prompt = f"""
-            You are an experienced HR professional with technical expertise across multiple domains including Data Science, Software Engineering, DevOPS, Machine Learning, AI, Full Stack Development, Marketing, and more.
-
-            Please provide a comprehensive professional evaluation of this resume:
-
-            **RESUME:**
-            {resume_text}
-
-            **ANALYSIS REQUIREMENTS:**
-            1. **Professional Summary**: One-line summary of the candidate's profile
-            2. **Experience Level**: Classify as Student/Intern/Junior/Mid-level/Senior/Executive
-            3. **Existing Skills**: List all technical and relevant soft skills found
-            4. **Skill Gaps**: Identify missing or weak skills for career growth
-            5. **Course Recommendations**: Suggest 3-5 specific courses/certifications to improve the resume
-            6. **Strengths**: Key positive aspects of the profile
-            7. **Areas for Improvement**: Specific recommendations for enhancement
-            8. **Industry Readiness**: Assessment of readiness for target roles
-            """
+            # With a context cache the resume is already server-side; only the JD is sent
+            model = None
+            if context_cache_names is not None:
+                model = self._get_context_cached_model(resume_text, context_cache_names)
+            if model is not None:
+                prompt_parts = ["Evaluate the cached resume.", self._select_section_prompt(resume_text)]
+            else:
+                model = self.model
+                prompt_parts = [
+                    f"RESUME:\n{resume_text[:MAX_RESUME_CHARS]}",
+                    self._select_section_prompt(resume_text)
+                ]
             
             if job_description:
-                base_prompt += f"""
-                
-                **JOB DESCRIPTION FOR COMPARISON:**
-                {job_description}
-                
-                **ADDITIONAL ANALYSIS FOR JOB FIT:**
-                9. **Job Compatibility Score**: Rate compatibility as a percentage (0-100%)
-                10. **Job-Specific Strengths**: How the candidate aligns with this specific role
-                11. **Job-Specific Gaps**: Missing requirements for this specific position
-                12. **Recommendation**: Whether to proceed with application and next steps
-                """
+                prompt_parts.append(f"JOB DESCRIPTION:\n{job_description[:MAX_RESUME_CHARS]}")
+                prompt_parts.append(ANALYSIS_JOB_FIT_PROMPT)
+            base_prompt = "\n\n".join(prompt_parts)
             
             progress.update("Generating AI analysis")
-            response = self.model.generate_content(base_prompt)
+            analysis_text = self._generate_analysis_text(model, base_prompt, on_chunk)
             
-            if not response or not response.text:
+            if not analysis_text:
                 raise ProcessingError("AI model returned empty response")
             
             progress.update("Processing results")
             analysis_result = {
-                'analysis': response.text.strip(),
+                'analysis': analysis_text.strip(),
                 'word_count': len(resume_text.split()),
                 'character_count': len(resume_text),
                 'timestamp': datetime.now().isoformat(),
                 'job_specific': bool(job_description)
             }
             
+            self.analysis_cache.set(cache_key, analysis_result)
+            
             progress.complete("Analysis complete")
             logger.info("Resume analysis completed successfully")
             return analysis_result
@@ -176,12 +356,159 @@ class ResumeAnalyzer:
         except Exception as e:
             logger.error(f"Resume analysis failed: {e}")
             raise ProcessingError(f"Failed to analyze resume: {e}")
+    
+    def _estimate_experience_bucket(self, resume_text: str) -> str:
+        """Cheaply bucket the candidate as junior/mid/senior from stated years of experience"""
+        years = [int(match) for match in YEARS_OF_EXPERIENCE_PATTERN.findall(resume_text)]
+        max_years = max((y for y in years if y <= 45), default=None)
+        
+        if max_years is not None:
+            if max_years >= 8:
+                return "senior"
+            if max_years >= 3:
+                return "mid"
+            return "junior"
+        
+        if EARLY_CAREER_PATTERN.search(resume_text):
+            return "junior"
+        return "mid"  # Full rubric when there is no clear signal
+    
+    def _select_section_prompt(self, resume_text: str) -> str:
+        """Pick the section rubric for the candidate's experience bucket"""
+        bucket = self._estimate_experience_bucket(resume_text)
+        logger.info(f"Using '{bucket}' analysis prompt")
+        return EXPERIENCE_BUCKET_PROMPTS[bucket]
+    
+    def _get_context_cached_model(self, resume_text: str, cache_names: Dict[str, Optional[str]]):
+        """
+        Return a model bound to a Gemini context cache of system prompt + resume.
+        Cache names are kept in cache_names per resume hash so repeat analyses
+        (e.g. against different job descriptions) only pay for the suffix tokens.
+        Returns None when caching is unavailable (e.g. resume below the minimum
+        cacheable token count).
+        """
+        cached_text = f"RESUME:\n{resume_text[:MAX_RESUME_CHARS]}"
+        estimated_tokens = (len(ANALYSIS_SYSTEM_PROMPT) + len(cached_text)) // CHARS_PER_TOKEN_ESTIMATE
+        if estimated_tokens < CONTEXT_CACHE_MIN_TOKENS:
+            return None
+        
+        import google.generativeai as genai
+        
+        resume_hash = generate_text_hash(resume_text)
+        if resume_hash in cache_names and cache_names[resume_hash] is None:
+            return None  # Caching already failed for this resume
+        
+        cache_name = cache_names.get(resume_hash)
+        try:
+            if cache_name is None:
+                cached_content = genai.caching.CachedContent.create(
+                    model=ANALYSIS_MODEL_NAME,
+                    system_instruction=ANALYSIS_SYSTEM_PROMPT,
+                    contents=[cached_text],
+                    ttl=CONTEXT_CACHE_TTL
+                )
+                cache_name = cached_content.name
+                cache_names[resume_hash] = cache_name
+                logger.info("Created Gemini context cache for resume")
+            
+            return genai.GenerativeModel.from_cached_content(cached_content=cache_name)
+        except Exception as e:
+            if cache_name is None:
+                cache_names[resume_hash] = None
+            else:
+                cache_names.pop(resume_hash, None)  # Expired; recreate next time
+            logger.info(f"Gemini context cache unavailable, sending full prompt: {e}")
+            return None
+    
+    def _generate_analysis_text(self, model, prompt: str, on_chunk: Optional[Callable[[str], Any]] = None) -> str:
+        """Generate analysis text, streaming partial output to on_chunk when provided"""
+        if on_chunk is None:
+            response = model.generate_content(prompt)
+            return response.text if response else ""
+        
+        text = ""
+        for chunk in model.generate_content(prompt, stream=True):
+            # Safety-blocked or finish-only chunks have no parts, and .text raises on them
+            if not chunk.parts:
+                continue
+            text += chunk.text
+            on_chunk(text)
+        return text
+
+@st.cache_resource
+def _get_analyzer() -> ResumeAnalyzer:
+    """Build the analyzer (AI model, extractor, matcher) once instead of on every rerun"""
+    return ResumeAnalyzer()
+
+@st.cache_resource
+def _build_custom_css() -> str:
+    """Render the theme CSS once per server; reruns get the same string back without pickling"""
+    theme = ui_config.theme_options["light"]
+    
+    return f"""
+    <style>
+    .main-header {{
+        background: linear-gradient(90deg, {theme['primary_color']}, {theme['accent_color']});
+        padding: 1rem;
+        border-radius: 10px;
+        margin-bottom: 2rem;
+        text-align: center;
+        color: white;
+    }}
+    
+    .metric-card {{
+        background-color: {theme['background_color']};
+        padding: 1rem;
+        border-radius: 8px;
+        border: 1px solid #e0e0e0;
+        margin: 0.5rem 0;
+    }}
+    
+    .job-card {{
+        background: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 4px solid {theme['accent_color']};
+        margin: 1rem 0;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }}
+    
+    .score-badge {{
+        background: {theme['accent_color']};
+        color: white;
+        padding: 0.2rem 0.8rem;
+        border-radius: 15px;
+        font-weight: bold;
+        display: inline-block;
+    }}
+    
+    .sidebar-section {{
+        background: {theme['background_color']};
+        padding: 1rem;
+        border-radius: 8px;
+        margin: 1rem 0;
+    }}
+    
+    /* General layout adjustments for removed sidebar */
+    .st-emotion-cache-18ni7ap {{
+        flex-direction: column;
+    }}
+    .st-emotion-cache-z5f0il {{
+        padding-right: 1rem;
+    }}
+
+    /* The new, definitive fix for all Streamlit versions */
+    [data-testid="stHeaderLink"] {{
+        display: none !important;
+    }}
+    </style>
+    """
 
 class EnhancedStreamlitApp:
     """Enhanced Streamlit application with better UI/UX and error handling"""
     
     def __init__(self):
-        self.analyzer = ResumeAnalyzer()
+        self.analyzer = _get_analyzer()
         self.setup_page_config()
         self.initialize_session_state()
     
@@ -203,76 +530,22 @@ class EnhancedStreamlitApp:
         if "resume_text" not in st.session_state:
             st.session_state.resume_text = ""
         
+        if "last_file_hash" not in st.session_state:
+            st.session_state.last_file_hash = None
+        
         if "candidate_profile" not in st.session_state:
             st.session_state.candidate_profile = None
         
         if "last_analysis" not in st.session_state:
             st.session_state.last_analysis = None
+        
+        if "gemini_cache_names" not in st.session_state:
+            st.session_state.gemini_cache_names = {}
     
     def apply_custom_css(self):
         """Apply custom CSS for better UI and to remove anchor links"""
-        theme = ui_config.theme_options["light"]
-        
-        css = f"""
-        <style>
-        .main-header {{
-            background: linear-gradient(90deg, {theme['primary_color']}, {theme['accent_color']});
-            padding: 1rem;
-            border-radius: 10px;
-            margin-bottom: 2rem;
-            text-align: center;
-            color: white;
-        }}
-        
-        .metric-card {{
-            background-color: {theme['background_color']};
-            padding: 1rem;
-            border-radius: 8px;
-            border: 1px solid #e0e0e0;
-            margin: 0.5rem 0;
-        }}
-        
-        .job-card {{
-            background: white;
-            padding: 1.5rem;
-            border-radius: 10px;
-            border-left: 4px solid {theme['accent_color']};
-            margin: 1rem 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .score-badge {{
-            background: {theme['accent_color']};
-            color: white;
-            padding: 0.2rem 0.8rem;
-            border-radius: 15px;
-            font-weight: bold;
-            display: inline-block;
-        }}
-        
-        .sidebar-section {{
-            background: {theme['background_color']};
-            padding: 1rem;
-            border-radius: 8px;
-            margin: 1rem 0;
-        }}
-        
-        /* General layout adjustments for removed sidebar */
-        .st-emotion-cache-18ni7ap {{
-            flex-direction: column;
-        }}
-        .st-emotion-cache-z5f0il {{
-            padding-right: 1rem;
-        }}
-
-        /* The new, definitive fix for all Streamlit versions */
-        [data-testid="stHeaderLink"] {{
-            display: none !important;
-        }}
-        </style>
-        """
-        
-        st.markdown(css, unsafe_allow_html=True)
+        # Injected on every full run: Streamlit removes elements a rerun does not re-emit
+        st.markdown(_build_custom_css(), unsafe_allow_html=True)
     
     @handle_streamlit_error
     def render_main_header(self):
@@ -285,6 +558,7 @@ class EnhancedStreamlitApp:
             unsafe_allow_html=True
         )
 
+    @st.fragment
     @handle_streamlit_error
     def render_resume_analysis_tab(self):
         """Render the resume analysis tab with enhanced features"""
@@ -329,24 +603,45 @@ class EnhancedStreamlitApp:
             try:
                 log_user_action("resume_analysis_started", {"filename": uploaded_file.name})
                 
-                # Extract text from PDF
-                with st.spinner("Extracting text from PDF..."):
-                    resume_text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                    st.session_state.resume_text = resume_text
+                # Extract text from PDF, skipping re-extraction when the upload is unchanged
+                file_hash = generate_file_hash_stream(uploaded_file)
+                if file_hash == st.session_state.last_file_hash and st.session_state.resume_text:
+                    resume_text = st.session_state.resume_text
+                    logger.info("Reusing extracted text for unchanged upload")
+                else:
+                    with st.spinner("Extracting text from PDF..."):
+                        resume_text = self.analyzer.extract_text_from_pdf(uploaded_file)
+                        st.session_state.resume_text = resume_text
+                        st.session_state.last_file_hash = file_hash
                 
                 # Show extracted text preview
                 with st.expander("Extracted Text Preview", expanded=False):
                     st.text_area("Resume Text", resume_text[:1000] + "..." if len(resume_text) > 1000 else resume_text, height=200)
                 
-                # Analyze resume
-                with st.spinner("Analyzing resume with AI..."):
-                    analysis = self.analyzer.analyze_resume(resume_text, job_description)
+                # Profile extraction is independent of the analysis, so it runs in a worker
+                # thread while the analysis streams on the script thread (which owns the UI)
+                executor = ThreadPoolExecutor(max_workers=1)
+                try:
+                    profile_future = executor.submit(
+                        self.analyzer.profile_extractor.extract_candidate_profile, resume_text
+                    )
+                    
+                    # Analyze resume, rendering the analysis as it streams in
+                    stream_placeholder = st.empty()
+                    analysis = self.analyzer.analyze_resume(
+                        resume_text, job_description, on_chunk=stream_placeholder.markdown,
+                        context_cache_names=st.session_state.gemini_cache_names
+                    )
+                    stream_placeholder.empty()
                     st.session_state.last_analysis = analysis
-                
-                # Extract candidate profile for job matching
-                with st.spinner("Extracting candidate profile..."):
-                    profile = self.analyzer.profile_extractor.extract_candidate_profile(resume_text)
-                    st.session_state.candidate_profile = profile
+                    
+                    # Extract candidate profile for job matching
+                    with st.spinner("Extracting candidate profile..."):
+                        profile = profile_future.result()
+                        st.session_state.candidate_profile = profile
+                finally:
+                    # Don't hold a failed analysis's error behind a still-running profile extraction
+                    executor.shutdown(wait=False, cancel_futures=True)
                 
                 display_success("Resume analysis completed successfully!")
                 
@@ -425,15 +720,17 @@ class EnhancedStreamlitApp:
                     for skill in skills[mid_point:]:
                         st.write(f"• {skill}")
     
-    @handle_streamlit_error 
+    @st.fragment
+    @handle_streamlit_error
     def render_job_matching_tab(self):
         """Render the job matching tab with enhanced features"""
         # Using markdown with an HTML 2 tag instead of st.header to avoid the anchor link
         st.markdown("<h2>Job Matching & Search</h2>", unsafe_allow_html=True)
         
+        # This tab reruns as a fragment, so the profile is checked again on every search
+        # click rather than hiding the controls until a full-page rerun
         if not st.session_state.candidate_profile:
             st.warning("Please analyze a resume first to enable job matching.")
-            return
         
         # Search controls
         col1, col2 = st.columns([2, 1])
@@ -469,6 +766,10 @@ class EnhancedStreamlitApp:
         
         # Search button
         if st.button("Search & Match Jobs", type="primary", use_container_width=True):
+            if not st.session_state.candidate_profile:
+                display_error("Please analyze a resume first to enable job matching.")
+                return
+            
             if not search_query:
                 display_error("Please enter a search query.")
                 return
@@ -488,8 +789,7 @@ class EnhancedStreamlitApp:
                 # Convert profile and rank jobs
                 with st.spinner("Analyzing job compatibility..."):
                     enhanced_profile = create_enhanced_profile_from_basic(st.session_state.candidate_profile)
-                    matcher = AdvancedJobMatcher()
-                    ranked_jobs = matcher.rank_jobs([job.to_dict() for job in jobs], enhanced_profile, max_results)
+                    ranked_jobs = self.analyzer.job_matcher.rank_jobs([job.to_dict() for job in jobs], enhanced_profile, max_results)
                 
                 # Display results
                 self._display_job_results(ranked_jobs)
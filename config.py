@@ -3,24 +3,30 @@ import os
 import logging
 from typing import Optional
 from dataclasses import dataclass
+from functools import cached_property
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-@dataclass
 class APIConfig:
-    """API Configuration settings"""
-    google_api_key: Optional[str] = None
-    adzuna_app_id: Optional[str] = None
-    adzuna_app_key: Optional[str] = None
-    rapidapi_key: Optional[str] = None
+    """API Configuration settings, read from the environment on first access"""
     
-    def __post_init__(self):
-        self.google_api_key = os.getenv("GOOGLE_API_KEY")
-        self.adzuna_app_id = os.getenv("ADZUNA_APP_ID")
-        self.adzuna_app_key = os.getenv("ADZUNA_APP_KEY")
-        self.rapidapi_key = os.getenv("RAPIDAPI_KEY")
+    @cached_property
+    def google_api_key(self) -> Optional[str]:
+        return os.getenv("GOOGLE_API_KEY")
+    
+    @cached_property
+    def adzuna_app_id(self) -> Optional[str]:
+        return os.getenv("ADZUNA_APP_ID")
+    
+    @cached_property
+    def adzuna_app_key(self) -> Optional[str]:
+        return os.getenv("ADZUNA_APP_KEY")
+    
+    @cached_property
+    def rapidapi_key(self) -> Optional[str]:
+        return os.getenv("RAPIDAPI_KEY")
 
 @dataclass
 class AppConfig:
@@ -2,19 +2,69 @@
 
 import os
 import time
+import atexit
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from functools import wraps
-import streamlit as st
+from typing import List, Dict, Optional, Any, Tuple, Iterator, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from datetime import datetime
+from functools import wraps, lru_cache
+from collections import deque, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from config import api_config, app_config
-from utils import retry_with_exponential_backoff, cache_key_generator
+from utils import (
+    retry_with_exponential_backoff, cache_key_generator, CACHE_DIR, ValidationError, ProcessingError
+)
+
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+    _JSON_PARSE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_PARSE_ERRORS = (ValueError,)
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Shared stand-in for missing nested objects in API payloads; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# Provider names and placeholders shared by the parsers and the result ranking
+NOT_AVAILABLE = "N/A"
+SOURCE_ADZUNA = "Adzuna"
+SOURCE_REMOTIVE = "Remotive"
+SOURCE_JSEARCH = "JSearch"
+DESCRIPTION_PREVIEW_CHARS = 500
+
+# Long-lived worker pools for provider and page fan-out. They are separate because provider
+# tasks block on their page tasks; sharing one bounded pool could deadlock under load.
+_PROVIDER_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="jobs-provider")
+_PAGE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="jobs-page")
+atexit.register(_PROVIDER_EXECUTOR.shutdown, wait=False)
+atexit.register(_PAGE_EXECUTOR.shutdown, wait=False)
+
+# Decoded bodies larger than this (or of unknown decoded size) are stream-parsed item by
+# item instead of decoded whole
+STREAM_PARSE_THRESHOLD_BYTES = 256 * 1024
+
+# Shared HTTP session so repeat searches reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+_session.headers.update({'User-Agent': 'ResumeAnalyzer/1.0'})
+
+@dataclass(slots=True)
 class JobResult:
     """Standardized job result structure"""
     title: str
@@ -28,13 +78,21 @@ class JobResult:
     date_posted: Optional[str] = None
     job_type: Optional[str] = None
     experience_level: Optional[str] = None
+    dedup_key: Tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Normalized once at construction so deduplication does no per-search string work
+        self.dedup_key = ((self.title or "").strip().lower(), (self.company or "").strip().lower())
 
     def to_dict(self) -> Dict[str, Any]:
+        description = self.description
+        if len(description) > DESCRIPTION_PREVIEW_CHARS:
+            description = description[:DESCRIPTION_PREVIEW_CHARS] + "..."
         return {
             "title": self.title,
             "company": self.company,
             "location": self.location,
-            "description": self.description[:500] + "..." if len(self.description) > 500 else self.description,
+            "description": description,
             "salary": (self.salary_min, self.salary_max) if self.salary_min or self.salary_max else None,
             "apply_url": self.apply_url,
             "source": self.source,
@@ -44,29 +102,39 @@ class JobResult:
         }
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """Sliding-window rate limiter for API calls"""
     def __init__(self, max_calls: int = 60, time_window: int = 60):
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        self.calls = deque()
+        self._lock = threading.Lock()
+
+    def _evict_expired(self, now: float):
+        # Timestamps are appended in order, so expired calls are always at the left
+        cutoff = now - self.time_window
+        while self.calls and self.calls[0] <= cutoff:
+            self.calls.popleft()
 
     def can_make_call(self) -> bool:
-        now = datetime.now()
-        # Remove old calls outside time window
-        self.calls = [call_time for call_time in self.calls 
-                     if now - call_time < timedelta(seconds=self.time_window)]
+        self._evict_expired(time.monotonic())
         return len(self.calls) < self.max_calls
 
     def record_call(self):
-        self.calls.append(datetime.now())
+        self.calls.append(time.monotonic())
 
     def wait_if_needed(self):
         if not self.can_make_call():
-            wait_time = self.time_window - (datetime.now() - min(self.calls)).total_seconds()
+            wait_time = self.time_window - (time.monotonic() - self.calls[0])
             if wait_time > 0:
-                logger.warning(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
+                logger.warning("Rate limit reached. Waiting %.2f seconds...", wait_time)
                 time.sleep(wait_time)
 
+    def acquire(self):
+        """Wait for a free slot and claim it atomically across worker threads"""
+        with self._lock:
+            self.wait_if_needed()
+            self.record_call()
+
 # Rate limiters for different APIs
 rate_limiters = {
     "adzuna": RateLimiter(100, 3600),  # 100 calls per hour
@@ -80,12 +148,45 @@ def with_rate_limiting(api_name: str):
         @wraps(func)
         def wrapper(*args, **kwargs):
             if api_name in rate_limiters:
-                rate_limiters[api_name].wait_if_needed()
-                rate_limiters[api_name].record_call()
+                rate_limiters[api_name].acquire()
             return func(*args, **kwargs)
         return wrapper
     return decorator
 
+# Searches currently in flight, keyed by API name and call arguments
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+def with_single_flight(api_name: str):
+    """Decorator that lets identical concurrent calls share one in-flight request"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = cache_key_generator(api_name, *args, **kwargs)
+            with _inflight_lock:
+                future = _inflight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = _inflight[key] = Future()
+            
+            if not is_leader:
+                logger.info("Joining in-flight %s search", api_name)
+                return future.result()
+            
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                with _inflight_lock:
+                    _inflight.pop(key, None)
+        return wrapper
+    return decorator
+
 def validate_search_params(query: str, location: str = None) -> bool:
     """Validate search parameters"""
     if not query or len(query.strip()) < 2:
@@ -97,254 +198,389 @@ def validate_search_params(query: str, location: str = None) -> bool:
     return True
 
 class JobSearchCache:
-    """Simple in-memory cache for job search results"""
-    def __init__(self, ttl: int = 3600):
-        self.cache = {}
+    """Bounded in-memory LRU cache with TTL, backed by an optional on-disk cache shared across restarts.
+
+    Expired entries that carry HTTP validators (ETag / Last-Modified) are kept for
+    stale_ttl more seconds so the next search can revalidate instead of re-downloading.
+    """
+    def __init__(self, ttl: int = 3600, max_size: int = 1024, disk_dir: Optional[Path] = CACHE_DIR / "jobs",
+                 stale_ttl: int = 86400):
+        self.cache = OrderedDict()
         self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        self.disk = None
+        if DiskCache is not None and disk_dir is not None:
+            try:
+                self.disk = DiskCache(str(disk_dir), size_limit=512 * 1024 * 1024)
+            except Exception as e:
+                logger.warning("Disk job cache unavailable, using memory only: %s", e)
 
     def get(self, key: str) -> Optional[List[JobResult]]:
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl:
-                logger.info(f"Cache hit for key: {key[:20]}...")
-                return data
-            else:
-                del self.cache[key]
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        data, fresh_until, validators = entry
+        if time.time() < fresh_until:
+            logger.info("Cache hit for key: %.20s...", key)
+            return data
+        if not validators:
+            with self._lock:
+                self.cache.pop(key, None)
         return None
 
-    def set(self, key: str, data: List[JobResult]):
-        self.cache[key] = (data, time.time())
-        logger.info(f"Cached results for key: {key[:20]}...")
+    def get_stale(self, key: str) -> Optional[Tuple[List[JobResult], Dict[str, str]]]:
+        """Return expired results and their validators if they can still be revalidated"""
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        data, fresh_until, validators = entry
+        if validators and time.time() < fresh_until + self.stale_ttl:
+            return data, validators
+        return None
+
+    def set(self, key: str, data: List[JobResult], validators: Optional[Dict[str, str]] = None):
+        entry = (data, time.time() + self.ttl, validators or {})
+        self._remember(key, entry)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, entry, expire=self.ttl + (self.stale_ttl if validators else 0))
+            except Exception as e:
+                logger.warning("Failed to persist job cache entry: %s", e)
+        logger.info("Cached results for key: %.20s...", key)
+
+    def _lookup(self, key: str) -> Optional[Tuple[List[JobResult], float, Dict[str, str]]]:
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.move_to_end(key)
+                return entry
+        
+        if self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                self._remember(key, entry)
+                logger.info("Disk cache hit for key: %.20s...", key)
+                return entry
+        return None
+
+    def _remember(self, key: str, entry: Tuple[List[JobResult], float, Dict[str, str]]):
+        with self._lock:
+            self.cache[key] = entry
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson on the raw bytes when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _adzuna_item_to_job(item: Dict[str, Any]) -> JobResult:
+    """Map one Adzuna result object to a JobResult"""
+    get = item.get
+    return JobResult(
+        title=get("title", NOT_AVAILABLE),
+        company=(get("company") or _EMPTY).get("display_name", NOT_AVAILABLE),
+        location=(get("location") or _EMPTY).get("display_name", NOT_AVAILABLE),
+        description=(get("description") or "")[:1000],  # Limit description length
+        salary_min=get("salary_min"),
+        salary_max=get("salary_max"),
+        apply_url=get("redirect_url", ""),
+        source=SOURCE_ADZUNA,
+        date_posted=get("created"),
+        job_type=get("contract_type")
+    )
+
+def _remotive_item_to_job(item: Dict[str, Any]) -> JobResult:
+    """Map one Remotive job object to a JobResult"""
+    get = item.get
+    return JobResult(
+        title=get("title", NOT_AVAILABLE),
+        company=get("company_name", NOT_AVAILABLE),
+        location=get("candidate_required_location", "Remote"),
+        description=(get("description") or "")[:1000],
+        apply_url=get("url", ""),
+        source=SOURCE_REMOTIVE,
+        date_posted=get("publication_date"),
+        job_type="Remote"
+    )
+
+def _jsearch_item_to_job(item: Dict[str, Any]) -> JobResult:
+    """Map one JSearch data object to a JobResult"""
+    get = item.get
+    return JobResult(
+        title=get("job_title", NOT_AVAILABLE),
+        company=get("employer_name", NOT_AVAILABLE),
+        location=get("job_city") or get("job_country", NOT_AVAILABLE),
+        description=(get("job_description") or "")[:1000],
+        salary_min=get("job_min_salary"),
+        salary_max=get("job_max_salary"),
+        apply_url=get("job_apply_link", ""),
+        source=SOURCE_JSEARCH,
+        date_posted=get("job_posted_at_datetime_utc"),
+        job_type=get("job_employment_type"),
+        experience_level=get("job_experience_in_place_of_education")
+    )
+
+def _decoded_length(response: requests.Response) -> Optional[int]:
+    """Body size after content decoding, or None when the headers don't say.
+
+    For gzip/deflate responses Content-Length is the compressed size, so it is not used.
+    """
+    if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+        return None
+    content_length = response.headers.get("Content-Length")
+    return int(content_length) if content_length else None
+
+def _iter_json_items(response: requests.Response, key: str) -> Iterator[Dict[str, Any]]:
+    """Yield the objects of a top-level JSON array, stream-parsing large bodies when ijson is available"""
+    try:
+        decoded_length = _decoded_length(response)
+        if ijson is not None and (decoded_length is None or decoded_length > STREAM_PARSE_THRESHOLD_BYTES):
+            # Let urllib3 undo gzip/deflate so ijson sees plain JSON
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+        else:
+            yield from _parse_json(response).get(key, [])
+    except _JSON_PARSE_ERRORS as e:
+        # A malformed payload would be just as malformed on retry
+        raise ValidationError(f"Malformed JSON response: {e}")
+    finally:
+        response.close()
 
 # Global cache instance
 job_cache = JobSearchCache(ttl=app_config.cache_ttl)
 
-@with_rate_limiting("adzuna")
-@retry_with_exponential_backoff(max_retries=3)
-def search_adzuna(query: str, location: str, country_code: str = "in",
-                 page: int = 1, results: int = 25) -> List[JobResult]:
-    """Search jobs using Adzuna API with enhanced error handling"""
+@dataclass(frozen=True)
+class APISpec:
+    """Declarative description of one job search provider"""
+    key: str  # Rate limiter and cache namespace
+    name: str
+    result_key: str  # Top-level array holding the job objects
+    build_request: Callable[..., Tuple[str, Dict[str, Any], Optional[Dict[str, str]]]]
+    item_to_job: Callable[[Dict[str, Any]], JobResult]
+    is_configured: Callable[[], bool] = lambda: True
+    status_errors: Dict[int, str] = field(default_factory=dict)
+    page_size: Optional[int] = None  # Largest page the provider serves; None if it does not paginate
+
+def _adzuna_request(query: str, location: Optional[str], country_code: str = "in",
+                    page: int = 1, results: int = 25):
+    url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/search/{page}"
+    params = {
+        "app_id": api_config.adzuna_app_id,
+        "app_key": api_config.adzuna_app_key,
+        "what": query.strip(),
+        "where": location.strip() if location else "",
+        "results_per_page": min(results, app_config.max_jobs_per_search),
+        "content-type": "application/json",
+    }
+    return url, params, None
+
+def _remotive_request(query: str, location: Optional[str], category: Optional[str] = None):
+    params = {"search": query.strip()}
+    if category:
+        params["category"] = category.strip()
+    return "https://remotive.com/api/remote-jobs", params, None
+
+def _jsearch_request(query: str, location: Optional[str], page: int = 1, results: int = 25):
+    params = {
+        "query": query.strip(),
+        "page": str(page),
+        "num_pages": "1",
+        "results_per_page": str(min(results, app_config.max_jobs_per_search))
+    }
+    if location:
+        params["location"] = location.strip()
+    headers = {
+        "X-RapidAPI-Key": api_config.rapidapi_key,
+        "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
+    }
+    return "https://jsearch.p.rapidapi.com/search", params, headers
+
+ADZUNA_SPEC = APISpec(
+    key="adzuna",
+    name=SOURCE_ADZUNA,
+    result_key="results",
+    build_request=_adzuna_request,
+    item_to_job=_adzuna_item_to_job,
+    is_configured=lambda: bool(api_config.adzuna_app_id and api_config.adzuna_app_key),
+    page_size=50
+)
+
+REMOTIVE_SPEC = APISpec(
+    key="remotive",
+    name=SOURCE_REMOTIVE,
+    result_key="jobs",
+    build_request=_remotive_request,
+    item_to_job=_remotive_item_to_job
+)
+
+JSEARCH_SPEC = APISpec(
+    key="jsearch",
+    name=SOURCE_JSEARCH,
+    result_key="data",
+    build_request=_jsearch_request,
+    item_to_job=_jsearch_item_to_job,
+    is_configured=lambda: bool(api_config.rapidapi_key),
+    status_errors={
+        403: "JSearch API access denied. Please verify API credentials and subscription.",
+        429: "JSearch API rate limit exceeded. Please try again later."
+    },
+    page_size=10
+)
+
+@lru_cache(maxsize=256)
+def _prepare_request(url: str, params: Tuple[Tuple[str, Any], ...],
+                     headers: Tuple[Tuple[str, str], ...]) -> requests.PreparedRequest:
+    """Build and memoize the encoded GET request for a URL, parameter and header set"""
+    return _session.prepare_request(requests.Request("GET", url, params=params, headers=dict(headers)))
+
+def _send_prepared(prepared: requests.PreparedRequest,
+                   extra_headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """Send a copy of a memoized request, honouring proxy and CA settings from the environment"""
+    request = prepared.copy()
+    if extra_headers:
+        request.headers.update(extra_headers)
+    settings = _session.merge_environment_settings(request.url, {}, True, None, None)
+    return _session.send(request, timeout=app_config.api_timeout, **settings)
+
+def _conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """Turn stored response validators into conditional request headers"""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+def _response_validators(response: requests.Response) -> Dict[str, str]:
+    """Collect the ETag / Last-Modified validators a response offers, if any"""
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["last_modified"] = response.headers["Last-Modified"]
+    return validators
+
+def _search_api(spec: APISpec, query: str, location: Optional[str] = None, **options) -> List[JobResult]:
+    """Validate, check the cache, fetch and parse one provider search"""
     try:
         validate_search_params(query, location)
 
-        if not api_config.adzuna_app_id or not api_config.adzuna_app_key:
-            logger.warning("Adzuna API credentials not configured")
+        if not spec.is_configured():
+            logger.warning("%s API credentials not configured", spec.name)
             return []
 
-        cache_key = cache_key_generator("adzuna", query, location, country_code, page, results)
+        cache_key = cache_key_generator(spec.key, query, location or "", **options)
         cached_results = job_cache.get(cache_key)
         if cached_results:
             return cached_results
 
-        base_url = "https://api.adzuna.com/v1/api/jobs/{country}/search/{page}"
-        url = base_url.format(country=country_code, page=page)
+        url, params, headers = spec.build_request(query, location, **options)
 
-        params = {
-            "app_id": api_config.adzuna_app_id,
-            "app_key": api_config.adzuna_app_key,
-            "what": query.strip(),
-            "where": location.strip() if location else "",
-            "results_per_page": min(results, app_config.max_jobs_per_search),
-            "content-type": "application/json",
-        }
+        logger.info("Searching %s for '%s' in '%s'", spec.name, query, location or "any location")
 
-        logger.info(f"Searching Adzuna for '{query}' in '{location}'")
+        # Expired results with validators let the provider answer 304 instead of resending the payload
+        stale = job_cache.get_stale(cache_key)
+        conditional = _conditional_headers(stale[1]) if stale else None
 
-        response = requests.get(
-            url,
-            params=params,
-            timeout=app_config.api_timeout,
-            headers={'User-Agent': 'ResumeAnalyzer/1.0'}
-        )
+        prepared = _prepare_request(url, tuple(params.items()), tuple((headers or {}).items()))
+        with _send_prepared(prepared, conditional) as response:
+            if stale and response.status_code == 304:
+                jobs, validators = stale
+                logger.info("%s results unchanged since last search; reusing %d cached jobs", spec.name, len(jobs))
+                job_cache.set(cache_key, jobs, validators)
+                return jobs
 
-        response.raise_for_status()
-        data = response.json()
+            status_error = spec.status_errors.get(response.status_code)
+            if status_error:
+                logger.error("%s API returned %d: %s", spec.name, response.status_code, status_error)
+                raise ValidationError(status_error)
 
-        jobs = []
-        for item in data.get("results", []):
-            try:
-                job = JobResult(
-                    title=item.get("title", "N/A"),
-                    company=(item.get("company") or {}).get("display_name", "N/A"),
-                    location=(item.get("location") or {}).get("display_name", "N/A"),
-                    description=item.get("description", "")[:1000],  # Limit description length
-                    salary_min=item.get("salary_min"),
-                    salary_max=item.get("salary_max"),
-                    apply_url=item.get("redirect_url", ""),
-                    source="Adzuna",
-                    date_posted=item.get("created"),
-                    job_type=item.get("contract_type")
-                )
-                jobs.append(job)
-            except Exception as e:
-                logger.warning(f"Error parsing Adzuna job item: {e}")
-                continue
+            response.raise_for_status()
+            validators = _response_validators(response)
+            jobs = list(map(spec.item_to_job, _iter_json_items(response, spec.result_key)))
 
-        logger.info(f"Retrieved {len(jobs)} jobs from Adzuna")
-        job_cache.set(cache_key, jobs)
+        logger.info("Retrieved %d jobs from %s", len(jobs), spec.name)
+        job_cache.set(cache_key, jobs, validators)
         return jobs
 
+    # ValidationError marks failures that would repeat on retry; ProcessingError ones may be transient
     except requests.exceptions.Timeout:
-        logger.error("Adzuna API timeout")
-        raise Exception("Adzuna search timed out. Please try again.")
+        logger.error("%s API timeout", spec.name)
+        raise ProcessingError(f"{spec.name} search timed out. Please try again.")
     except requests.exceptions.RequestException as e:
-        logger.error(f"Adzuna API request failed: {e}")
-        raise Exception(f"Adzuna search failed: {str(e)}")
+        logger.error("%s API request failed: %s", spec.name, e)
+        status = e.response.status_code if e.response is not None else None
+        error_type = ValidationError if status and 400 <= status < 500 and status != 429 else ProcessingError
+        raise error_type(f"{spec.name} search failed: {str(e)}")
+    except (ValueError, ValidationError) as e:
+        # Rejected parameters, provider status errors and malformed payloads
+        logger.error("%s search error: %s", spec.name, e)
+        raise ValidationError(f"{spec.name} search encountered an error: {str(e)}")
     except Exception as e:
-        logger.error(f"Adzuna search error: {e}")
-        raise Exception(f"Adzuna search encountered an error: {str(e)}")
+        logger.error("%s search error: %s", spec.name, e)
+        raise ProcessingError(f"{spec.name} search encountered an error: {str(e)}")
+
+def _search_paginated(spec: APISpec, fetch_page: Callable[..., List[JobResult]], query: str,
+                      location: Optional[str], page: int, results: int, **options) -> List[JobResult]:
+    """Fetch as many provider pages as results needs, concurrently and in page order"""
+    page_size = min(spec.page_size, app_config.max_jobs_per_search)
+    page_count = max(1, -(-results // page_size))
+    if page_count == 1:
+        return fetch_page(query, location, page=page, results=results, **options)
+    
+    futures = [
+        _PAGE_EXECUTOR.submit(fetch_page, query, location, page=page + offset, results=page_size, **options)
+        for offset in range(page_count)
+    ]
+    jobs = []
+    for offset, future in enumerate(futures):
+        try:
+            jobs.extend(future.result())
+        except Exception as e:
+            # The first page carries the provider's error; later gaps just end the result set
+            if offset == 0:
+                raise
+            logger.warning("%s page %d failed, returning earlier pages: %s", spec.name, page + offset, e)
+            break
+    return jobs[:results]
+
+@with_single_flight("adzuna")
+@with_rate_limiting("adzuna")
+@retry_with_exponential_backoff(max_retries=3, retry_on=(ProcessingError,))
+def _search_adzuna_page(query: str, location: str, country_code: str = "in",
+                        page: int = 1, results: int = 25) -> List[JobResult]:
+    return _search_api(ADZUNA_SPEC, query, location, country_code=country_code, page=page, results=results)
 
+def search_adzuna(query: str, location: str, country_code: str = "in",
+                 page: int = 1, results: int = 25) -> List[JobResult]:
+    """Search jobs using Adzuna API with enhanced error handling"""
+    return _search_paginated(ADZUNA_SPEC, _search_adzuna_page, query, location,
+                             page=page, results=results, country_code=country_code)
+
+@with_single_flight("remotive")
 @with_rate_limiting("remotive")
-@retry_with_exponential_backoff(max_retries=3)
+@retry_with_exponential_backoff(max_retries=3, retry_on=(ProcessingError,))
 def search_remotive(query: str, category: str = None) -> List[JobResult]:
     """Search remote jobs using Remotive API with enhanced error handling"""
-    try:
-        validate_search_params(query)
-
-        cache_key = cache_key_generator("remotive", query, category or "")
-        cached_results = job_cache.get(cache_key)
-        if cached_results:
-            return cached_results
-
-        base_url = "https://remotive.com/api/remote-jobs"
-        params = {"search": query.strip()}
-        if category:
-            params["category"] = category.strip()
-
-        logger.info(f"Searching Remotive for '{query}'")
-
-        response = requests.get(
-            base_url,
-            params=params,
-            timeout=app_config.api_timeout,
-            headers={'User-Agent': 'ResumeAnalyzer/1.0'}
-        )
-
-        response.raise_for_status()
-        data = response.json()
-
-        jobs = []
-        for item in data.get("jobs", []):
-            try:
-                job = JobResult(
-                    title=item.get("title", "N/A"),
-                    company=item.get("company_name", "N/A"),
-                    location=item.get("candidate_required_location", "Remote"),
-                    description=(item.get("description") or "")[:1000],
-                    apply_url=item.get("url", ""),
-                    source="Remotive",
-                    date_posted=item.get("publication_date"),
-                    job_type="Remote"
-                )
-                jobs.append(job)
-            except Exception as e:
-                logger.warning(f"Error parsing Remotive job item: {e}")
-                continue
-
-        logger.info(f"Retrieved {len(jobs)} jobs from Remotive")
-        job_cache.set(cache_key, jobs)
-        return jobs
-
-    except requests.exceptions.Timeout:
-        logger.error("Remotive API timeout")
-        raise Exception("Remotive search timed out. Please try again.")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Remotive API request failed: {e}")
-        raise Exception(f"Remotive search failed: {str(e)}")
-    except Exception as e:
-        logger.error(f"Remotive search error: {e}")
-        raise Exception(f"Remotive search encountered an error: {str(e)}")
+    return _search_api(REMOTIVE_SPEC, query, category=category)
 
+@with_single_flight("jsearch")
 @with_rate_limiting("jsearch")
-@retry_with_exponential_backoff(max_retries=3)
+@retry_with_exponential_backoff(max_retries=3, retry_on=(ProcessingError,))
+def _search_jsearch_page(query: str, location: str = None, page: int = 1,
+                         results: int = 25) -> List[JobResult]:
+    return _search_api(JSEARCH_SPEC, query, location, page=page, results=results)
+
 def search_jsearch(query: str, location: str = None, page: int = 1,
                   results: int = 25) -> List[JobResult]:
     """Search jobs using JSearch API via RapidAPI with enhanced error handling"""
-    try:
-        validate_search_params(query, location)
-
-        if not api_config.rapidapi_key:
-            logger.warning("JSearch/RapidAPI key not configured")
-            return []
-
-        cache_key = cache_key_generator("jsearch", query, location or "", page, results)
-        cached_results = job_cache.get(cache_key)
-        if cached_results:
-            return cached_results
-
-        # FIXED: Consistent variable naming
-        base_url = "https://jsearch.p.rapidapi.com/search"
-
-        params = {
-            "query": query.strip(),
-            "page": str(page),
-            "num_pages": "1",
-            "results_per_page": str(min(results, app_config.max_jobs_per_search))
-        }
-
-        if location:
-            params["location"] = location.strip()
-
-        headers = {
-            "X-RapidAPI-Key": api_config.rapidapi_key,
-            "X-RapidAPI-Host": "jsearch.p.rapidapi.com",
-            "User-Agent": "ResumeAnalyzer/1.0"
-        }
-
-        logger.info(f"Searching JSearch for '{query}' in '{location or 'any location'}'")
-
-        response = requests.get(
-            base_url,
-            params=params,
-            headers=headers,
-            timeout=app_config.api_timeout
-        )
-
-        # Enhanced error handling for JSearch specific issues
-        if response.status_code == 403:
-            logger.error("JSearch API returned 403 Forbidden - check API key and subscription")
-            raise Exception("JSearch API access denied. Please verify API credentials and subscription.")
-        elif response.status_code == 429:
-            logger.error("JSearch API rate limit exceeded")
-            raise Exception("JSearch API rate limit exceeded. Please try again later.")
-
-        response.raise_for_status()
-        data = response.json()
-
-        jobs = []
-        for item in data.get("data", []):
-            try:
-                job = JobResult(
-                    title=item.get("job_title", "N/A"),
-                    company=item.get("employer_name", "N/A"),
-                    location=item.get("job_city") or item.get("job_country", "N/A"),
-                    description=(item.get("job_description") or "")[:1000],
-                    salary_min=item.get("job_min_salary"),
-                    salary_max=item.get("job_max_salary"),
-                    apply_url=item.get("job_apply_link", ""),
-                    source="JSearch",
-                    date_posted=item.get("job_posted_at_datetime_utc"),
-                    job_type=item.get("job_employment_type"),
-                    experience_level=item.get("job_experience_in_place_of_education")
-                )
-                jobs.append(job)
-            except Exception as e:
-                logger.warning(f"Error parsing JSearch job item: {e}")
-                continue
-
-        logger.info(f"Retrieved {len(jobs)} jobs from JSearch")
-        job_cache.set(cache_key, jobs)
-        return jobs
-
-    except requests.exceptions.Timeout:
-        logger.error("JSearch API timeout")
-        raise Exception("JSearch search timed out. Please try again.")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"JSearch API request failed: {e}")
-        raise Exception(f"JSearch search failed: {str(e)}")
-    except Exception as e:
-        logger.error(f"JSearch search error: {e}")
-        raise Exception(f"JSearch search encountered an error: {str(e)}")
+    return _search_paginated(JSEARCH_SPEC, _search_jsearch_page, query, location,
+                             page=page, results=results)
 
 def search_all_apis(query: str, location: str = None, max_results: int = 50) -> List[JobResult]:
     """Search all available job APIs and combine results"""
@@ -357,42 +593,50 @@ def search_all_apis(query: str, location: str = None, max_results: int = 50) ->
 
     # Define search functions
     search_functions = [
-        ("Adzuna", lambda: search_adzuna(query, location or "India", results=max_results//3)),
-        ("Remotive", lambda: search_remotive(query)),
-        ("JSearch", lambda: search_jsearch(query, location, results=max_results//3))
+        (SOURCE_ADZUNA, lambda: search_adzuna(query, location or "India", results=max_results//3)),
+        (SOURCE_REMOTIVE, lambda: search_remotive(query)),
+        (SOURCE_JSEARCH, lambda: search_jsearch(query, location, results=max_results//3))
     ]
 
-    for api_name, search_func in search_functions:
+    # Query all providers concurrently; total latency is the slowest provider, not the sum
+    results = {}
+    futures = {_PROVIDER_EXECUTOR.submit(search_func): api_name for api_name, search_func in search_functions}
+    for future in as_completed(futures):
+        api_name = futures[future]
         try:
-            jobs = search_func()
-            all_jobs.extend(jobs)
-            logger.info(f"Successfully retrieved {len(jobs)} jobs from {api_name}")
+            results[api_name] = future.result()
+            logger.info("Successfully retrieved %d jobs from %s", len(results[api_name]), api_name)
         except Exception as e:
             error_msg = f"Failed to search {api_name}: {str(e)}"
             logger.error(error_msg)
             errors.append(error_msg)
 
+    # Combine in provider order so deduplication does not depend on which API answered first
+    for api_name, _ in search_functions:
+        all_jobs.extend(results.get(api_name, []))
+
     # Remove duplicates based on title and company
     unique_jobs = []
     seen = set()
     for job in all_jobs:
-        job_key = (job.title.lower().strip(), job.company.lower().strip())
-        if job_key not in seen:
-            seen.add(job_key)
+        if job.dedup_key not in seen:
+            seen.add(job.dedup_key)
             unique_jobs.append(job)
 
-    logger.info(f"Retrieved {len(unique_jobs)} unique jobs from {len(search_functions)} APIs")
+    logger.info("Retrieved %d unique jobs from %d APIs", len(unique_jobs), len(search_functions))
 
     if errors and not unique_jobs:
         raise Exception(f"All job search APIs failed: {'; '.join(errors)}")
     elif errors:
-        logger.warning(f"Some APIs failed but got results: {'; '.join(errors)}")
+        logger.warning("Some APIs failed but got results: %s", "; ".join(errors))
 
     # Sort by relevance (you can enhance this with better scoring)
+    # list.sort evaluates the key once per job, so only the query needs hoisting
+    query_lower = query.lower()
     unique_jobs.sort(key=lambda job: (
-        query.lower() in job.title.lower(),
-        query.lower() in job.description.lower(),
-        job.source == "JSearch"  # Prefer JSearch results
+        query_lower in job.title.lower(),
+        query_lower in job.description.lower(),
+        job.source == SOURCE_JSEARCH  # Prefer JSearch results
     ), reverse=True)
 
     return unique_jobs[:max_results]
@@ -1,15 +1,153 @@
 # matching.py - Enhanced Job Matching Algorithm with ML and NLP
 import re
+import json
 import logging
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Tuple, Any, Optional, FrozenSet
 from dataclasses import dataclass, field
 from collections import Counter
 import math
+import heapq
+from operator import itemgetter
+from functools import lru_cache
 from datetime import datetime
 
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _weighted_overlap_kernel(flat_ids: np.ndarray, offsets: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Sum candidate skill weights over each job's integer-encoded skills (CSR layout)"""
+    n_jobs = len(offsets) - 1
+    out = np.zeros(n_jobs)
+    for i in range(n_jobs):
+        total = 0.0
+        for k in range(offsets[i], offsets[i + 1]):
+            total += weights[flat_ids[k]]
+        out[i] = total
+    return out
+
+def _composite_score_loop(matrix: np.ndarray, columns: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Per-row weighted sum of feature columns, with skills/10 and keywords/5 capped at 1, scaled to 0-100"""
+    n_rows = matrix.shape[0]
+    out = np.empty(n_rows)
+    for i in range(n_rows):
+        total = 0.0
+        for k in range(len(columns)):
+            column = columns[k]
+            value = matrix[i, column]
+            if column == 0:
+                value = min(value / 10, 1.0)
+            elif column == 1:
+                value = min(value / 5, 1.0)
+            total += value * weights[k]
+        out[i] = min(total * 100, 100.0)
+    return out
+
+def _composite_score_columns(matrix: np.ndarray, columns: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Column-wise NumPy equivalent of _composite_score_loop, used when numba is unavailable"""
+    matrix = matrix.copy()
+    matrix[:, 0] = np.minimum(matrix[:, 0] / 10, 1.0)
+    matrix[:, 1] = np.minimum(matrix[:, 1] / 5, 1.0)
+    scores = np.zeros(matrix.shape[0])
+    for column, weight in zip(columns, weights):
+        scores += matrix[:, column] * weight
+    return np.minimum(scores * 100, 100)
+
+# No fastmath: both paths must add terms in the same order to give identical scores
+if _NUMBA_AVAILABLE:
+    _weighted_overlap_kernel = njit(cache=True)(_weighted_overlap_kernel)
+    _composite_score_kernel = njit(cache=True)(_composite_score_loop)
+else:
+    _composite_score_kernel = _composite_score_columns
+
+# Default technical skills database
+DEFAULT_SKILL_DATABASE = (
+    # Programming languages
+    "python", "java", "javascript", "c++", "c#", "go", "rust", "kotlin", "swift",
+    "php", "ruby", "scala", "r", "matlab", "sql", "html", "css",
+    
+    # Frameworks and libraries
+    "react", "angular", "vue", "django", "flask", "spring", "node.js", "express",
+    "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
+    
+    # Tools and platforms
+    "aws", "azure", "gcp", "docker", "kubernetes", "git", "jenkins", "terraform",
+    "ansible", "linux", "windows", "macos",
+    
+    # Databases
+    "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra",
+    
+    # Soft skills
+    "leadership", "communication", "teamwork", "problem-solving", "project management",
+    "agile", "scrum", "devops", "machine learning", "data analysis", "data science",
+    "artificial intelligence", "cybersecurity"
+)
+
+@lru_cache(maxsize=8)
+def _compile_skill_patterns(skill_database: Tuple[str, ...]) -> Tuple[Tuple[str, "re.Pattern"], ...]:
+    """Compile word-boundary patterns for a skill database once and reuse them"""
+    return tuple(
+        (skill, re.compile(r'\b' + re.escape(skill.lower()) + r'\b'))
+        for skill in skill_database
+    )
+
+_DEFAULT_SKILL_PATTERNS = _compile_skill_patterns(DEFAULT_SKILL_DATABASE)
+
+@lru_cache(maxsize=8)
+def _build_skill_automaton(skill_database: Tuple[str, ...]):
+    """Build one Aho-Corasick automaton over a skill database, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    
+    # Skills that differ only by case share one key; the payload lists their database positions
+    indexes_by_skill: Dict[str, List[int]] = {}
+    for index, skill in enumerate(skill_database):
+        if skill:
+            indexes_by_skill.setdefault(skill.lower(), []).append(index)
+    if not indexes_by_skill:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for skill_lower, indexes in indexes_by_skill.items():
+        automaton.add_word(skill_lower, (len(skill_lower), tuple(indexes)))
+    automaton.make_automaton()
+    return automaton
+
+# Built at import, like the default patterns, so the first extraction does not pay for it
+_DEFAULT_SKILL_AUTOMATON = _build_skill_automaton(DEFAULT_SKILL_DATABASE)
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Same test as a regex word boundary at index: word-ness differs on either side"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+# Technical terms (C++, .NET, Node.js), acronyms (AWS, SQL) and hyphenated terms. They are
+# scanned separately because their matches overlap, which a single alternation would drop.
+_TOKEN_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'[A-Za-z0-9+#\.]{2,}',
+        r'\b[A-Z]{2,}\b',
+        r'\b[A-Za-z]+(?:-[A-Za-z]+)*\b'
+    )
+)
+
+@dataclass(slots=True)
 class MatchingFeatures:
     """Features extracted for job matching"""
     skill_matches: int = 0
@@ -38,6 +176,48 @@ class MatchingFeatures:
             self.education_match
         ]
 
+# Weight key and MatchingFeatures vector column for each term of the composite score, in summation order
+COMPOSITE_SCORE_COLUMNS = (
+    ('skills', 0),
+    ('keywords', 1),
+    ('title', 2),
+    ('location', 3),
+    ('experience', 4),
+    ('industry', 5),
+    ('salary', 7),
+    ('remote', 8)
+)
+
+# Experience keywords in priority order, with the level each implies
+JOB_EXPERIENCE_KEYWORDS = (
+    ("junior", "junior"),
+    ("senior", "senior"),
+    ("lead", "senior"),
+    ("manager", "executive"),
+    ("director", "executive"),
+    ("entry", "junior"),
+    ("experienced", "mid")
+)
+
+# (candidate level, job level) -> compatibility; unlisted pairs score 0.5
+EXPERIENCE_COMPATIBILITY = {
+    ("junior", "junior"): 1.0,
+    ("junior", "mid"): 0.8,
+    ("mid", "junior"): 0.6,
+    ("mid", "mid"): 1.0,
+    ("mid", "senior"): 0.8,
+    ("senior", "mid"): 0.9,
+    ("senior", "senior"): 1.0,
+    ("senior", "executive"): 0.7,
+    ("executive", "senior"): 0.8,
+    ("executive", "executive"): 1.0
+}
+
+EXPERIENCE_LEVELS = ("junior", "mid", "senior", "executive")
+_EXPERIENCE_LEVEL_INDEX = {level: i for i, level in enumerate(EXPERIENCE_LEVELS)}
+
+REMOTE_INDICATORS = ("remote", "work from home", "wfh", "telecommute", "distributed")
+
 @dataclass
 class EnhancedCandidateProfile:
     """Enhanced candidate profile with more sophisticated matching data"""
@@ -63,6 +243,42 @@ class EnhancedCandidateProfile:
     skill_proficiency: Dict[str, float] = field(default_factory=dict)  # skill -> proficiency (0-1)
     career_progression: List[str] = field(default_factory=list)
     certifications: List[str] = field(default_factory=list)
+    
+    @property
+    def skills_set(self) -> FrozenSet[str]:
+        """Lowercased skills for O(1) membership checks, always in step with skills"""
+        return frozenset(skill.lower() for skill in self.skills)
+
+@dataclass(frozen=True)
+class ProfileTerms:
+    """Lowercased profile terms, prepared once per ranking instead of once per job"""
+    keywords: Tuple[str, ...] = ()
+    target_roles: Tuple[str, ...] = ()
+    preferred_locations: Tuple[str, ...] = ()
+    # Compatibility of the candidate's level with each job level, indexed like EXPERIENCE_LEVELS
+    experience_row: Tuple[float, ...] = (0.5,) * len(EXPERIENCE_LEVELS)
+    
+    @classmethod
+    def from_profile(cls, profile: EnhancedCandidateProfile) -> "ProfileTerms":
+        return cls(
+            keywords=tuple(kw.lower() for kw in profile.keywords),
+            target_roles=tuple(role.lower() for role in profile.target_roles),
+            preferred_locations=tuple(loc.lower() for loc in profile.preferred_locations),
+            experience_row=tuple(
+                EXPERIENCE_COMPATIBILITY.get((profile.experience_level, job_level), 0.5)
+                for job_level in EXPERIENCE_LEVELS
+            )
+        )
+
+@dataclass(frozen=True)
+class PreparedJob:
+    """Lowercased job fields and extracted skills, computed once per job per ranking"""
+    text: str
+    title: str
+    location: str
+    skills: Tuple[str, ...] = ()
+    experience_index: int = _EXPERIENCE_LEVEL_INDEX["mid"]
+    is_remote: bool = False
 
 class TextProcessor:
     """Enhanced text processing for better matching"""
@@ -73,56 +289,50 @@ class TextProcessor:
         if not text:
             return []
         
-        # Patterns for technical terms, programming languages, etc.
-        patterns = [
-            r'[A-Za-z0-9+#\.]{2,}',  # Technical terms like C++, .NET, Node.js
-            r'\b[A-Z]{2,}\b',        # Acronyms like AWS, API, SQL
-            r'\b[A-Za-z]+(?:-[A-Za-z]+)*\b'  # Hyphenated terms
-        ]
-        
         tokens = set()
-        for pattern in patterns:
-            tokens.update(re.findall(pattern, text, re.IGNORECASE))
+        for pattern in _TOKEN_PATTERNS:
+            tokens.update(pattern.findall(text))
         
         return list(tokens)
     
     @staticmethod
     def extract_skills(text: str, skill_database: List[str] = None) -> List[str]:
         """Extract skills from text using a skill database"""
-        if skill_database is None:
-            # Default technical skills database
-            skill_database = [
-                # Programming languages
-                "python", "java", "javascript", "c++", "c#", "go", "rust", "kotlin", "swift",
-                "php", "ruby", "scala", "r", "matlab", "sql", "html", "css",
-                
-                # Frameworks and libraries
-                "react", "angular", "vue", "django", "flask", "spring", "node.js", "express",
-                "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
-                
-                # Tools and platforms
-                "aws", "azure", "gcp", "docker", "kubernetes", "git", "jenkins", "terraform",
-                "ansible", "linux", "windows", "macos",
-                
-                # Databases
-                "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra",
-                
-                # Soft skills
-                "leadership", "communication", "teamwork", "problem-solving", "project management",
-                "agile", "scrum", "devops", "machine learning", "data analysis", "data science",
-                "artificial intelligence", "cybersecurity"
-            ]
-        
+        skill_database = DEFAULT_SKILL_DATABASE if skill_database is None else tuple(skill_database)
         text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skill_database:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
         
-        return found_skills
+        # One pass over the text for all skills; word boundaries are checked per hit
+        automaton = _build_skill_automaton(skill_database)
+        if automaton is not None:
+            found = set()
+            for end, (length, indexes) in automaton.iter(text_lower):
+                if _is_word_boundary(text_lower, end - length + 1) and _is_word_boundary(text_lower, end + 1):
+                    found.update(indexes)
+            return [skill_database[index] for index in sorted(found)]
+        
+        skill_patterns = _compile_skill_patterns(skill_database)
+        return [skill for skill, pattern in skill_patterns if pattern.search(text_lower)]
+
+@lru_cache(maxsize=1024)
+def _prepare_job_fields(title: str, description: str, company: str, location: str) -> PreparedJob:
+    """Job-side matching data, memoized by content so re-ranking the same jobs skips the scans"""
+    job_text = " ".join([title, description, company]).lower()
+    
+    # The first listed keyword present decides the level
+    experience_level = "mid"  # default
+    for keyword, level in JOB_EXPERIENCE_KEYWORDS:
+        if keyword in job_text:
+            experience_level = level
+            break
+    
+    return PreparedJob(
+        text=job_text,
+        title=title.lower(),
+        location=location.lower(),
+        skills=tuple(TextProcessor.extract_skills(job_text)),
+        experience_index=_EXPERIENCE_LEVEL_INDEX[experience_level],
+        is_remote=any(indicator in job_text for indicator in REMOTE_INDICATORS)
+    )
 
 class AdvancedJobMatcher:
     """Advanced job matching with multiple algorithms"""
@@ -142,114 +352,89 @@ class AdvancedJobMatcher:
             'remote': 0.05
         }
     
-    def calculate_tf_idf_similarity(self, profile_text: str, job_text: str) -> float:
-        """Calculate TF-IDF similarity between profile and job"""
-        try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.metrics.pairwise import cosine_similarity
-            
-            vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
-            tfidf_matrix = vectorizer.fit_transform([profile_text, job_text])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return similarity
-        except ImportError:
-            logger.warning("sklearn not available, using basic similarity")
-            return self._basic_text_similarity(profile_text, job_text)
+    def prepare_job(self, job: Dict[str, Any]) -> PreparedJob:
+        """Lowercase a job's text fields and extract its skills once"""
+        return _prepare_job_fields(
+            job.get("title", ""),
+            job.get("description", ""),
+            job.get("company", ""),
+            job.get("location", "")
+        )
     
-    def _basic_text_similarity(self, text1: str, text2: str) -> float:
-        """Basic text similarity using Jaccard index"""
-        tokens1 = set(self.text_processor.tokenize_advanced(text1))
-        tokens2 = set(self.text_processor.tokenize_advanced(text2))
-        
-        if not tokens1 or not tokens2:
-            return 0.0
+    def _candidate_skill_arrays(self, profile: EnhancedCandidateProfile) -> Tuple[Dict[str, int], np.ndarray]:
+        """Structure-of-arrays view of the candidate skills: skill -> id, plus a weight per id.
         
-        intersection = tokens1.intersection(tokens2)
-        union = tokens1.union(tokens2)
+        A skill's weight is its proficiency if known, otherwise 1. The array has one extra
+        trailing zero-weight slot that every skill the candidate lacks maps to.
+        """
+        skills = tuple(profile.skills_set)
+        skill_to_id = {skill: i for i, skill in enumerate(skills)}
         
-        return len(intersection) / len(union) if union else 0.0
+        weights = np.zeros(len(skills) + 1)
+        if profile.skill_proficiency:
+            get_proficiency = profile.skill_proficiency.get
+            weights[:-1] = np.fromiter((get_proficiency(skill, 0.5) for skill in skills),
+                                       dtype=np.float64, count=len(skills))
+        else:
+            weights[:-1] = 1.0
+        return skill_to_id, weights
     
-    def extract_features(self, job: Dict[str, Any], profile: EnhancedCandidateProfile) -> MatchingFeatures:
+    def batch_skill_scores(self, jobs_skills: List[List[str]], profile: EnhancedCandidateProfile) -> np.ndarray:
+        """Score candidate skill overlap for many jobs in one kernel call"""
+        skill_to_id, weights = self._candidate_skill_arrays(profile)
+        missing_id = len(skill_to_id)
+        
+        flat_ids = []
+        offsets = [0]
+        for skills in jobs_skills:
+            flat_ids.extend(skill_to_id.get(skill, missing_id) for skill in skills)
+            offsets.append(len(flat_ids))
+        
+        return _weighted_overlap_kernel(
+            np.array(flat_ids, dtype=np.int64),
+            np.array(offsets, dtype=np.int64),
+            weights
+        )
+    
+    def extract_features(self, job: Dict[str, Any], profile: EnhancedCandidateProfile,
+                         skill_score: Optional[float] = None,
+                         terms: Optional[ProfileTerms] = None,
+                         prepared: Optional[PreparedJob] = None) -> MatchingFeatures:
         """Extract matching features between job and profile"""
         features = MatchingFeatures()
+        if terms is None:
+            terms = ProfileTerms.from_profile(profile)
+        if prepared is None:
+            prepared = self.prepare_job(job)
         
         # Job text for analysis
-        job_text = " ".join([
-            job.get("title", ""),
-            job.get("description", ""),
-            job.get("company", "")
-        ]).lower()
-        
-        job_title = job.get("title", "").lower()
-        job_location = job.get("location", "").lower()
-        
-        # 1. Skill matching
-        job_skills = self.text_processor.extract_skills(job_text)
-        profile_skills_lower = [skill.lower() for skill in profile.skills]
+        job_text = prepared.text
+        job_title = prepared.title
+        job_location = prepared.location
         
-        matched_skills = set(job_skills).intersection(set(profile_skills_lower))
-        features.skill_matches = len(matched_skills)
-        
-        # Weight by skill proficiency if available
-        if profile.skill_proficiency:
-            weighted_skill_score = sum(
-                profile.skill_proficiency.get(skill, 0.5) 
-                for skill in matched_skills
-            )
-            features.skill_matches = weighted_skill_score
+        # 1. Skill matching (weighted by skill proficiency if available)
+        if skill_score is None:
+            skill_score = self.batch_skill_scores([prepared.skills], profile)[0]
+        features.skill_matches = float(skill_score) if profile.skill_proficiency else int(skill_score)
         
         # 2. Keyword matching
-        keywords_lower = [kw.lower() for kw in profile.keywords]
-        keyword_matches = sum(1 for kw in keywords_lower if kw in job_text)
+        keyword_matches = sum(map(job_text.__contains__, terms.keywords))
         features.keyword_matches = keyword_matches
         
         # 3. Title relevance
-        target_roles_lower = [role.lower() for role in profile.target_roles]
-        title_matches = sum(1 for role in target_roles_lower if role in job_title)
-        features.title_relevance = min(title_matches / max(len(target_roles_lower), 1), 1.0)
+        title_matches = sum(map(job_title.__contains__, terms.target_roles))
+        features.title_relevance = min(title_matches / max(len(terms.target_roles), 1), 1.0)
         
         # 4. Location matching
-        if profile.preferred_locations:
-            location_matches = sum(
-                1 for loc in profile.preferred_locations 
-                if loc.lower() in job_location
-            )
-            features.location_match = min(location_matches / len(profile.preferred_locations), 1.0)
+        if terms.preferred_locations:
+            location_matches = sum(map(job_location.__contains__, terms.preferred_locations))
+            features.location_match = min(location_matches / len(terms.preferred_locations), 1.0)
         
         # 5. Experience matching
-        job_exp_keywords = ["junior", "senior", "lead", "manager", "director", "entry", "experienced"]
-        job_exp_level = "mid"  # default
-        
-        for keyword in job_exp_keywords:
-            if keyword in job_text:
-                if keyword in ["junior", "entry"]:
-                    job_exp_level = "junior"
-                elif keyword in ["senior", "lead"]:
-                    job_exp_level = "senior"
-                elif keyword in ["manager", "director"]:
-                    job_exp_level = "executive"
-                break
-        
-        exp_compatibility = {
-            ("junior", "junior"): 1.0,
-            ("junior", "mid"): 0.8,
-            ("mid", "junior"): 0.6,
-            ("mid", "mid"): 1.0,
-            ("mid", "senior"): 0.8,
-            ("senior", "mid"): 0.9,
-            ("senior", "senior"): 1.0,
-            ("senior", "executive"): 0.7,
-            ("executive", "senior"): 0.8,
-            ("executive", "executive"): 1.0
-        }
-        
-        features.experience_match = exp_compatibility.get(
-            (profile.experience_level, job_exp_level), 0.5
-        )
+        features.experience_match = terms.experience_row[prepared.experience_index]
         
         # 6. Remote work preference
-        remote_indicators = ["remote", "work from home", "wfh", "telecommute", "distributed"]
-        job_is_remote = any(indicator in job_text for indicator in remote_indicators)
+        job_is_remote = prepared.is_remote
         
         if profile.remote_preference and job_is_remote:
             features.remote_preference = 1.0
@@ -261,8 +446,8 @@ class AdvancedJobMatcher:
             features.remote_preference = 0.6
         
         # 7. Salary compatibility
-        job_salary_min = job.get("salary", (None, None))[0] if job.get("salary") else None
-        job_salary_max = job.get("salary", (None, None))[1] if job.get("salary") else None
+        salary = job.get("salary")
+        job_salary_min, job_salary_max = (salary[0], salary[1]) if salary else (None, None)
         
         if (job_salary_min and profile.salary_expectation_min and 
             job_salary_max and profile.salary_expectation_max):
@@ -288,27 +473,38 @@ class AdvancedJobMatcher:
     
     def calculate_composite_score(self, features: MatchingFeatures) -> float:
         """Calculate weighted composite matching score"""
-        feature_scores = {
-            'skills': min(features.skill_matches / 10, 1.0),  # Normalize to 0-1
-            'keywords': min(features.keyword_matches / 5, 1.0),
-            'title': features.title_relevance,
-            'location': features.location_match,
-            'experience': features.experience_match,
-            'industry': features.industry_match,
-            'salary': features.salary_compatibility,
-            'remote': features.remote_preference
-        }
-        
-        weighted_score = sum(
-            score * self.weights.get(criterion, 0)
-            for criterion, score in feature_scores.items()
+        # Straight-line sum in criterion order; weights are read per call so edits to self.weights apply
+        weight = self.weights.get
+        weighted_score = (
+            min(features.skill_matches / 10, 1.0) * weight('skills', 0)  # Normalize to 0-1
+            + min(features.keyword_matches / 5, 1.0) * weight('keywords', 0)
+            + features.title_relevance * weight('title', 0)
+            + features.location_match * weight('location', 0)
+            + features.experience_match * weight('experience', 0)
+            + features.industry_match * weight('industry', 0)
+            + features.salary_compatibility * weight('salary', 0)
+            + features.remote_preference * weight('remote', 0)
         )
         
         return min(weighted_score * 100, 100)  # Scale to 0-100
     
-    def score_job(self, job: Dict[str, Any], profile: EnhancedCandidateProfile) -> Tuple[float, MatchingFeatures]:
+    def batch_composite_scores(self, features_list: List[MatchingFeatures]) -> np.ndarray:
+        """Calculate composite scores for many feature sets in one kernel call"""
+        if not features_list:
+            return np.zeros(0)
+        
+        matrix = np.array([features.get_feature_vector() for features in features_list], dtype=np.float64)
+        
+        # Terms are accumulated in calculate_composite_score's order so scores match it bit for bit
+        columns = np.array([column for _, column in COMPOSITE_SCORE_COLUMNS], dtype=np.int64)
+        weights = np.array([self.weights.get(criterion, 0) for criterion, _ in COMPOSITE_SCORE_COLUMNS],
+                           dtype=np.float64)
+        return _composite_score_kernel(matrix, columns, weights)
+    
+    def score_job(self, job: Dict[str, Any], profile: EnhancedCandidateProfile,
+                  skill_score: Optional[float] = None) -> Tuple[float, MatchingFeatures]:
         """Score a single job against candidate profile"""
-        features = self.extract_features(job, profile)
+        features = self.extract_features(job, profile, skill_score)
         score = self.calculate_composite_score(features)
         
         logger.debug(f"Job '{job.get('title', 'Unknown')}' scored {score:.1f}")
@@ -317,21 +513,45 @@ class AdvancedJobMatcher:
     def rank_jobs(self, jobs: List[Dict[str, Any]], profile: EnhancedCandidateProfile, 
                   top_k: int = 20) -> List[Tuple[float, Dict[str, Any], MatchingFeatures]]:
         """Rank jobs by relevance to candidate profile"""
-        scored_jobs = []
+        if top_k <= 0 or not jobs:
+            return []
         
+        # Job text and skills are prepared once, then skill overlap is scored in one kernel call
+        prepared_jobs = []
         for job in jobs:
             try:
-                score, features = self.score_job(job, profile)
-                scored_jobs.append((score, job, features))
+                prepared_jobs.append(self.prepare_job(job))
+            except Exception:
+                prepared_jobs.append(None)  # Scoring below logs and skips the bad job
+        # A malformed profile fails every job, so log it once and rank nothing, as per-job scoring did
+        try:
+            skill_scores = self.batch_skill_scores(
+                [prepared.skills if prepared else () for prepared in prepared_jobs], profile
+            )
+            terms = ProfileTerms.from_profile(profile)
+        except Exception as e:
+            logger.warning(f"Error preparing candidate profile for ranking: {e}")
+            return []
+        
+        scored = []
+        for job, prepared, skill_score in zip(jobs, prepared_jobs, skill_scores):
+            try:
+                scored.append((job, self.extract_features(job, profile, skill_score, terms, prepared)))
             except Exception as e:
                 logger.warning(f"Error scoring job {job.get('title', 'Unknown')}: {e}")
                 continue
         
-        # Sort by score (descending)
-        scored_jobs.sort(key=lambda x: x[0], reverse=True)
+        scores = self.batch_composite_scores([features for _, features in scored])
+        scored_jobs = [
+            (score, job, features)
+            for score, (job, features) in zip(scores.tolist(), scored)
+        ]
         
-        logger.info(f"Ranked {len(scored_jobs)} jobs, returning top {min(top_k, len(scored_jobs))}")
-        return scored_jobs[:top_k]
+        # Partial selection of the top_k by score (descending); ties keep input order like a stable sort
+        top_jobs = heapq.nlargest(top_k, scored_jobs, key=itemgetter(0))
+        
+        logger.info(f"Ranked {len(scored_jobs)} jobs, returning top {len(top_jobs)}")
+        return top_jobs
 
 def create_enhanced_profile_from_basic(basic_profile: Dict[str, Any]) -> EnhancedCandidateProfile:
     """Convert basic profile to enhanced profile with intelligent defaults"""
@@ -364,18 +584,30 @@ def create_enhanced_profile_from_basic(basic_profile: Dict[str, Any]) -> Enhance
     return enhanced
 
 # Backward compatibility functions
+_default_matcher = AdvancedJobMatcher()
+
+@lru_cache(maxsize=64)
+def _enhanced_profile_from_json(profile_json: str) -> EnhancedCandidateProfile:
+    return create_enhanced_profile_from_basic(json.loads(profile_json))
+
+def _get_enhanced_profile(profile: Dict[str, Any]) -> EnhancedCandidateProfile:
+    """Build the enhanced profile once per distinct basic profile across backward compatible calls"""
+    try:
+        profile_json = json.dumps(profile, sort_keys=True)
+    except TypeError:
+        return create_enhanced_profile_from_basic(profile)  # Not JSON-serializable; skip the cache
+    return _enhanced_profile_from_json(profile_json)
+
 def score_job(job: Dict[str, Any], profile: Dict[str, Any]) -> int:
     """Backward compatible scoring function"""
-    matcher = AdvancedJobMatcher()
-    enhanced_profile = create_enhanced_profile_from_basic(profile)
-    score, _ = matcher.score_job(job, enhanced_profile)
+    enhanced_profile = _get_enhanced_profile(profile)
+    score, _ = _default_matcher.score_job(job, enhanced_profile)
     return int(score)
 
 def rank_jobs(jobs: List[Dict[str, Any]], profile: Dict[str, Any], top_k: int = 20) -> List[Tuple[int, Dict[str, Any]]]:
     """Backward compatible ranking function"""
-    matcher = AdvancedJobMatcher()
-    enhanced_profile = create_enhanced_profile_from_basic(profile)
-    ranked = matcher.rank_jobs(jobs, enhanced_profile, top_k)
+    enhanced_profile = _get_enhanced_profile(profile)
+    ranked = _default_matcher.rank_jobs(jobs, enhanced_profile, top_k)
     
     # Convert to old format
-    return [(int(score), job) for score, job, _ in ranked]
\ No newline at end of file
+    return [(int(score), job) for score, job, _ in ranked]
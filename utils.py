@@ -1,17 +1,37 @@
 # utils.py - Enhanced Utilities with Error Handling and Validation
 import os
+import re
 import time
+import random
 import hashlib
 import tempfile
 import functools
+import json
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 import logging
-import streamlit as st
 from contextlib import contextmanager
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
+# Default location for persisted result caches
+CACHE_DIR = Path.home() / ".cache" / "resume_analyzer"
+# Persisted results older than this are recomputed
+RESULT_CACHE_TTL = 7 * 24 * 3600
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_FORMATTING_RE = re.compile(r'[\s\-\(\)\+]')
+
+# Characters that are unsafe in filenames, each mapped to '_'
+_FILENAME_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -20,8 +40,12 @@ class ProcessingError(Exception):
     """Custom exception for processing errors"""
     pass
 
-def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0):
-    """Decorator for retrying functions with exponential backoff"""
+def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0,
+                                   retry_on: tuple = (Exception,), jitter: float = 0.25):
+    """Decorator for retrying functions with jittered exponential backoff.
+    
+    Only exceptions matching retry_on are retried; anything else propagates on the first attempt.
+    """
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -29,12 +53,15 @@ def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
+                    if not isinstance(e, retry_on):
+                        raise
                     if attempt == max_retries - 1:
                         logger.error(f"Function {func.__name__} failed after {max_retries} attempts: {str(e)}")
                         raise e
                     
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. Retrying in {delay}s...")
+                    # Jitter spreads out callers that failed together, e.g. on a shared rate limit
+                    delay = base_delay * (2 ** attempt) * (1 + random.random() * jitter)
+                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. Retrying in {delay:.2f}s...")
                     time.sleep(delay)
         return wrapper
     return decorator
@@ -66,10 +93,13 @@ def validate_file(uploaded_file, max_size_mb: int = 10, allowed_types: List[str]
     
     # Check if file is actually a PDF (basic check)
     if uploaded_file.name.lower().endswith('.pdf'):
-        # Read first few bytes to check PDF signature
-        uploaded_file.seek(0)
-        header = uploaded_file.read(4)
-        uploaded_file.seek(0)
+        # Read first few bytes to check PDF signature; in-memory uploads are sliced without seeking
+        if hasattr(uploaded_file, "getvalue"):
+            header = uploaded_file.getvalue()[:4]
+        else:
+            uploaded_file.seek(0)
+            header = uploaded_file.read(4)
+            uploaded_file.seek(0)
         if header != b'%PDF':
             raise ValidationError("Invalid PDF file format")
     
@@ -80,15 +110,106 @@ def sanitize_filename(filename: str) -> str:
     """Sanitize filename to prevent security issues"""
     # Remove path traversal attempts
     filename = os.path.basename(filename)
-    # Remove or replace dangerous characters
-    dangerous_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-    for char in dangerous_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    # Replace dangerous characters in a single pass
+    return filename.translate(_FILENAME_SANITIZE_TABLE)
+
+def _new_key_hasher():
+    """Non-cryptographic 128-bit hasher for cache keys: xxh3 when available, else BLAKE2b"""
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
 
 def generate_file_hash(file_content: bytes) -> str:
     """Generate hash for file content for caching purposes"""
-    return hashlib.md5(file_content).hexdigest()
+    hasher = _new_key_hasher()
+    hasher.update(file_content)
+    return hasher.hexdigest()
+
+def generate_file_hash_stream(file_obj, chunk_size: int = 1 << 20) -> str:
+    """Hash a seekable file object in chunks; same digest as generate_file_hash on its bytes"""
+    hasher = _new_key_hasher()
+    position = file_obj.tell()
+    file_obj.seek(0)
+    try:
+        while chunk := file_obj.read(chunk_size):
+            hasher.update(chunk)
+    finally:
+        file_obj.seek(position)
+    return hasher.hexdigest()
+
+def generate_text_hash(*parts: str) -> str:
+    """Generate a stable SHA-256 key from one or more text parts"""
+    # NUL-terminated parts keep ("a|b", "") and ("a", "b|") from colliding, as in cache_key_generator
+    return hashlib.sha256(b"".join(part.encode("utf-8") + b"\x00" for part in parts)).hexdigest()
+
+class ResultCache:
+    """Two-level (memory + disk) cache for JSON-serializable results; the memory level is an LRU.
+
+    Entries older than ttl seconds are dropped from both levels; disk entries are aged by file mtime.
+    """
+    def __init__(self, namespace: str, cache_dir: Path = CACHE_DIR, max_memory_items: int = 256,
+                 ttl: int = RESULT_CACHE_TTL):
+        self.memory = OrderedDict()
+        self.max_memory_items = max_memory_items
+        self.cache_dir = Path(cache_dir) / namespace
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, data: Dict[str, Any], stored_at: float):
+        with self._lock:
+            self.memory[key] = (data, stored_at)
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_memory_items:
+                self.memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _expired(self, stored_at: float) -> bool:
+        return time.time() - stored_at > self.ttl
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                if self._expired(entry[1]):
+                    del self.memory[key]
+                    entry = None
+                else:
+                    self.memory.move_to_end(key)
+        if entry is not None:
+            logger.info(f"Memory cache hit for key: {key[:12]}...")
+            return entry[0]
+
+        path = self._path(key)
+        try:
+            stored_at = path.stat().st_mtime
+        except OSError:
+            return None
+        if self._expired(stored_at):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._remember(key, data, stored_at)
+            logger.info(f"Disk cache hit for key: {key[:12]}...")
+            return data
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read cache entry {path}: {e}")
+        return None
+
+    def set(self, key: str, data: Dict[str, Any]):
+        self._remember(key, data, time.time())
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._path(key), "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to persist cache entry for key {key[:12]}...: {e}")
 
 @contextmanager
 def temporary_file(suffix: str = None):
@@ -130,13 +251,12 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB"]
+    size_names = ("B", "KB", "MB", "GB")
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit exactly (no log rounding)
     size_index = 0
-    size = float(size_bytes)
-    
-    while size >= 1024.0 and size_index < len(size_names) - 1:
-        size /= 1024.0
-        size_index += 1
+    if size_bytes >= 1024:
+        size_index = min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
+    size = size_bytes / (1 << (10 * size_index))
     
     return f"{size:.1f} {size_names[size_index]}"
 
@@ -147,31 +267,36 @@ def clean_text(text: str) -> str:
     
     # Remove excessive whitespace
     text = ' '.join(text.split())
-    # Remove special characters that might cause issues
-    text = text.encode('ascii', 'ignore').decode('ascii')
-    return text.strip()
+    # Remove special characters that might cause issues; pure-ASCII text has none to drop
+    if not text.isascii():
+        text = text.encode('ascii', 'ignore').decode('ascii').strip()
+    return text
 
 def validate_email(email: str) -> bool:
     """Basic email validation"""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 def validate_phone(phone: str) -> bool:
     """Basic phone number validation"""
-    import re
     # Remove common formatting characters
-    phone = re.sub(r'[\s\-\(\)\+]', '', phone)
+    phone = _PHONE_FORMATTING_RE.sub('', phone)
     # Check if it contains only digits and is reasonable length
     return phone.isdigit() and 10 <= len(phone) <= 15
 
 def cache_key_generator(*args, **kwargs) -> str:
     """Generate cache key from arguments"""
-    key_data = str(args) + str(sorted(kwargs.items()))
-    return hashlib.md5(key_data.encode()).hexdigest()
+    # NUL-terminated fields keep ("a,b",) and ("a", "b") from colliding; bytes are hashed as-is
+    # rather than through their repr, and all fields go to the hasher in one update
+    fields = [arg if isinstance(arg, bytes) else str(arg).encode() for arg in args]
+    fields.extend(f"{name}={value}".encode() for name, value in sorted(kwargs.items()))
+    fields.append(b"")
+    hasher = _new_key_hasher()
+    hasher.update(b"\x00".join(fields))
+    return hasher.hexdigest()
 
 def display_error(error_msg: str, error_type: str = "error"):
     """Display error message in Streamlit with appropriate styling"""
+    import streamlit as st
     if error_type == "error":
         st.error(f"❌ {error_msg}")
     elif error_type == "warning":
@@ -183,11 +308,13 @@ def display_error(error_msg: str, error_type: str = "error"):
 
 def display_success(success_msg: str):
     """Display success message in Streamlit"""
+    import streamlit as st
     st.success(f"✅ {success_msg}")
     logger.info(f"UI Success displayed: {success_msg}")
 
 def create_progress_tracker(total_steps: int, description: str = "Processing"):
     """Create a progress tracker for long-running operations"""
+    import streamlit as st
     progress_bar = st.progress(0)
     status_text = st.empty()
     
@@ -217,6 +344,7 @@ def create_progress_tracker(total_steps: int, description: str = "Processing"):
 
 def log_user_action(action: str, details: Dict[str, Any] = None):
     """Log user actions for analytics and debugging"""
+    import streamlit as st
     log_entry = {
         "timestamp": time.time(),
         "action": action,
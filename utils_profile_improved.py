@@ -1,14 +1,24 @@
 # utils_profile.py - Enhanced Profile Extraction with Better Error Handling
 import json
 import logging
-import re
-from typing import Dict, List, Optional, Any
-import google.generativeai as genai
-from utils import retry_with_exponential_backoff, safe_execute
+import threading
+from typing import Dict, List, Optional, Any, Iterable
+from utils import retry_with_exponential_backoff, safe_execute, generate_text_hash, ResultCache
 from config import api_config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _parse_json(json_str: str) -> Any:
+    """Decode a JSON string, using orjson when available (its errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
 ENHANCED_PROFILE_SYSTEM_PROMPT = """
 Extract a comprehensive candidate profile as pure JSON with the following structure:
 
@@ -46,12 +56,56 @@ Guidelines:
 RESUME:
 """
 
+# Role -> skills that suggest it; a role is inferred when at least two are present
+ROLE_SKILL_REQUIREMENTS = {
+    "software engineer": frozenset(["python", "java", "javascript", "c++", "programming"]),
+    "data scientist": frozenset(["python", "machine learning", "tensorflow", "pandas", "statistics"]),
+    "web developer": frozenset(["html", "css", "javascript", "react", "angular", "node.js"]),
+    "mobile developer": frozenset(["android", "ios", "react native", "flutter", "kotlin", "swift"]),
+    "devops engineer": frozenset(["docker", "kubernetes", "aws", "jenkins", "terraform"]),
+    "data analyst": frozenset(["sql", "excel", "tableau", "power bi", "python", "r"]),
+    "product manager": frozenset(["product management", "agile", "scrum", "roadmap"]),
+    "project manager": frozenset(["project management", "pmp", "scrum", "agile"])
+}
+
+# Typical experience for a stated level, used when the resume gives no duration
+EXPERIENCE_LEVEL_MONTHS = {
+    "student": 0,
+    "intern": 6,
+    "junior": 24,
+    "mid": 60,
+    "senior": 120,
+    "executive": 180
+}
+
+# Display titles paired with their skill sets, title-cased once at import
+_TITLED_ROLE_SKILLS = tuple((role.title(), skills) for role, skills in ROLE_SKILL_REQUIREMENTS.items())
+
 class ProfileExtractor:
     """Enhanced profile extraction with better error handling and validation"""
     
+    # Common skill spellings -> canonical name, keyed by lowercased skill
+    _NORMALIZATIONS = {
+        "js": "javascript",
+        "ts": "typescript", 
+        "py": "python",
+        "ml": "machine learning",
+        "ai": "artificial intelligence",
+        "db": "database",
+        "html5": "html",
+        "css3": "css",
+        "reactjs": "react",
+        "nodejs": "node.js",
+        "vuejs": "vue",
+        "angularjs": "angular"
+    }
+    
     def __init__(self):
-        self.model = None
-        self._initialize_model()
+        # The Gemini client is created on first use, so importing this module stays cheap
+        self._model = None
+        self._model_initialized = False
+        self._model_lock = threading.Lock()
+        self.profile_cache = ResultCache("profile")
         
         # Skill categories for better classification
         self.skill_categories = {
@@ -85,30 +139,37 @@ class ProfileExtractor:
             ]
         }
     
+    @property
+    def model(self):
+        """The Gemini model, initialized on first access (None if unavailable)"""
+        if not self._model_initialized:
+            with self._model_lock:
+                if not self._model_initialized:
+                    self._initialize_model()
+                    self._model_initialized = True
+        return self._model
+    
     def _initialize_model(self):
         """Initialize the Gemini model"""
         try:
             if not api_config.google_api_key:
                 logger.error("Google API key not configured")
                 return
-                
+            
+            import google.generativeai as genai
             genai.configure(api_key=api_config.google_api_key)
-            self.model = genai.GenerativeModel("gemini-2.5-flash")
+            self._model = genai.GenerativeModel("gemini-2.5-flash")
             logger.info("Gemini model initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Gemini model: {e}")
-            self.model = None
+            self._model = None
     
     def _clean_json_response(self, response_text: str) -> str:
         """Clean and extract JSON from AI response"""
         if not response_text:
             return "{}"
         
-        # Remove markdown code blocks if present
-        response_text = re.sub(r'```json\s*', '', response_text)
-        response_text = re.sub(r'```\s*', '', response_text)
-        
-        # Find JSON content between braces
+        # Find JSON content between braces; markdown code fences contain none, so they fall outside
         start = response_text.find("{")
         end = response_text.rfind("}")
         
@@ -166,38 +227,13 @@ class ProfileExtractor:
         return validated_profile
     
     def _enhance_skills(self, skills: List[str]) -> List[str]:
-        """Enhance skills list by categorizing and normalizing"""
-        enhanced_skills = set()
-        
-        for skill in skills:
-            skill_lower = skill.lower().strip()
-            if len(skill_lower) < 2:  # Skip too short skills
-                continue
-            
-            # Normalize common variations
-            skill_normalized = self._normalize_skill(skill_lower)
-            enhanced_skills.add(skill_normalized)
-        
-        return list(enhanced_skills)
-    
-    def _normalize_skill(self, skill: str) -> str:
-        """Normalize skill names for consistency"""
-        normalizations = {
-            "js": "javascript",
-            "ts": "typescript", 
-            "py": "python",
-            "ml": "machine learning",
-            "ai": "artificial intelligence",
-            "db": "database",
-            "html5": "html",
-            "css3": "css",
-            "reactjs": "react",
-            "nodejs": "node.js",
-            "vuejs": "vue",
-            "angularjs": "angular"
-        }
-        
-        return normalizations.get(skill.lower(), skill)
+        """Enhance skills list by normalizing common variations and dropping duplicates"""
+        normalize = self._NORMALIZATIONS.get
+        return list({
+            normalize(skill, skill)
+            for skill in (raw_skill.lower().strip() for raw_skill in skills)
+            if len(skill) >= 2  # Skip too short skills
+        })
     
     def _infer_missing_data(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         """Infer missing profile data based on available information"""
@@ -207,46 +243,28 @@ class ProfileExtractor:
         
         # Infer experience level from total experience months
         if profile.get("total_experience_months", 0) == 0 and profile.get("experience_level"):
-            exp_mapping = {
-                "student": 0,
-                "intern": 6,
-                "junior": 24,
-                "mid": 60,
-                "senior": 120,
-                "executive": 180
-            }
-            profile["total_experience_months"] = exp_mapping.get(profile["experience_level"], 24)
+            profile["total_experience_months"] = EXPERIENCE_LEVEL_MONTHS.get(profile["experience_level"], 24)
         
         # Infer keywords from skills and target roles
         if not profile.get("keywords"):
-            keywords = set()
-            keywords.update(profile.get("skills", [])[:10])  # Add top skills as keywords
-            keywords.update(profile.get("target_roles", []))
-            profile["keywords"] = list(keywords)
+            # Top skills plus target roles, deduplicated in one set display
+            profile["keywords"] = list({*profile.get("skills", [])[:10], *profile.get("target_roles", [])})
         
         return profile
     
-    def _infer_roles_from_skills(self, skills: List[str]) -> List[str]:
-        """Infer potential job roles from skills"""
-        skill_set = set(skill.lower() for skill in skills)
-        role_mappings = {
-            "software engineer": ["python", "java", "javascript", "c++", "programming"],
-            "data scientist": ["python", "machine learning", "tensorflow", "pandas", "statistics"],
-            "web developer": ["html", "css", "javascript", "react", "angular", "node.js"],
-            "mobile developer": ["android", "ios", "react native", "flutter", "kotlin", "swift"],
-            "devops engineer": ["docker", "kubernetes", "aws", "jenkins", "terraform"],
-            "data analyst": ["sql", "excel", "tableau", "power bi", "python", "r"],
-            "product manager": ["product management", "agile", "scrum", "roadmap"],
-            "project manager": ["project management", "pmp", "scrum", "agile"]
-        }
+    def _infer_roles_from_skills(self, skills: Iterable[str]) -> List[str]:
+        """Infer potential job roles from skills (any iterable of skill names)"""
+        skill_set = {skill.lower() for skill in skills}
         
-        potential_roles = []
-        for role, required_skills in role_mappings.items():
-            matches = sum(1 for req_skill in required_skills if req_skill in skill_set)
+        role_matches = []
+        for role, required_skills in _TITLED_ROLE_SKILLS:
+            matches = len(skill_set & required_skills)
             if matches >= 2:  # Require at least 2 matching skills
-                potential_roles.append(role.title())
+                role_matches.append((matches, role))
         
-        return potential_roles[:5]  # Return top 5 roles
+        # Stable sort: roles with equal match counts keep their listed order
+        role_matches.sort(key=lambda item: item[0], reverse=True)
+        return [role for _, role in role_matches[:5]]  # Return top 5 roles
     
     @retry_with_exponential_backoff(max_retries=3)
     def extract_candidate_profile(self, resume_text: str) -> Dict[str, Any]:
@@ -255,6 +273,13 @@ class ProfileExtractor:
             logger.warning("Empty resume text provided")
             return self._get_default_profile("Empty resume text")
         
+        # A cached profile needs no model, so look it up before the availability check
+        cache_key = generate_text_hash(resume_text)
+        cached_profile = self.profile_cache.get(cache_key)
+        if cached_profile:
+            logger.info("Returning cached candidate profile")
+            return cached_profile
+        
         if not self.model:
             logger.error("Gemini model not available")
             return self._get_default_profile("Model not available")
@@ -273,7 +298,7 @@ class ProfileExtractor:
             
             # Clean and parse JSON
             json_str = self._clean_json_response(response.text)
-            profile = json.loads(json_str)
+            profile = _parse_json(json_str)
             
             # Validate and enhance profile
             profile = self._validate_profile(profile)
@@ -284,6 +309,7 @@ class ProfileExtractor:
                 profile["skills"] = self._enhance_skills(profile["skills"])
             
             logger.info(f"Successfully extracted profile with {len(profile.get('skills', []))} skills")
+            self.profile_cache.set(cache_key, profile)
             return profile
             
         except json.JSONDecodeError as e: